@@ -2,37 +2,23 @@
 MOI Python SDK
 
 A Python client library for interacting with the MOI Catalog Service.
+
+Public names are resolved lazily (PEP 562): ``import moi`` does not load any
+submodule until one of the exported names below is first accessed. Prefer
+explicit imports (``from moi import RawClient``); ``from moi import *`` binds
+every name in ``__all__`` and therefore loads every submodule. Deprecated
+aliases are never part of ``__all__``.
 """
 
-from .client import RawClient
-from .errors import APIError, HTTPError, ErrBaseURLRequired, ErrAPIKeyRequired, ErrNilRequest
-from .sdk_client import SDKClient, TablePrivInfo, ExistedTableOption, ExistedTableOptions
-from .stream import FileStream, DataAnalysisStream
-from .models import (
-    DataAnalysisRequest,
-    DataAnalysisConfig,
-    DataAnalysisStreamEvent,
-    InitEventData,
-    DataSource,
-    DataAskingTableConfig,
-    FileConfig,
-    FilterConditions,
-    DataScope,
-    CodeGroup,
-    QuestionType,
-    DedupBy,
-    DedupStrategy,
-    DedupConfig,
-    new_dedup_config,
-    new_dedup_config_skip_by_name_and_md5,
-    new_dedup_config_skip_by_name,
-    new_dedup_config_skip_by_md5,
-)
+from importlib import import_module
+from types import MappingProxyType
 
-__version__ = "0.1.0"
-__all__ = [
+from ._version import __version__
+
+__all__ = (
     "RawClient",
     "SDKClient",
+    "get_client",
     "TablePrivInfo",
     "ExistedTableOption",
     "ExistedTableOptions",
@@ -61,5 +47,79 @@ __all__ = [
     "new_dedup_config_skip_by_name_and_md5",
     "new_dedup_config_skip_by_name",
     "new_dedup_config_skip_by_md5",
-]
+)
+
+# Exported name -> owning submodule (read-only).
+_LAZY = MappingProxyType({
+    "RawClient": "client",
+    "SDKClient": "sdk_client",
+    "get_client": "sdk_client",
+    "TablePrivInfo": "sdk_client",
+    "ExistedTableOption": "sdk_client",
+    "ExistedTableOptions": "sdk_client",
+    "APIError": "errors",
+    "HTTPError": "errors",
+    "ErrBaseURLRequired": "errors",
+    "ErrAPIKeyRequired": "errors",
+    "ErrNilRequest": "errors",
+    "FileStream": "stream",
+    "DataAnalysisStream": "stream",
+    "DataAnalysisRequest": "models",
+    "DataAnalysisConfig": "models",
+    "DataAnalysisStreamEvent": "models",
+    "InitEventData": "models",
+    "DataSource": "models",
+    "DataAskingTableConfig": "models",
+    "FileConfig": "models",
+    "FilterConditions": "models",
+    "DataScope": "models",
+    "CodeGroup": "models",
+    "QuestionType": "models",
+    "DedupBy": "models",
+    "DedupStrategy": "models",
+    "DedupConfig": "models",
+    "new_dedup_config": "models",
+    "new_dedup_config_skip_by_name_and_md5": "models",
+    "new_dedup_config_skip_by_name": "models",
+    "new_dedup_config_skip_by_md5": "models",
+})
+
+# Submodule -> every exported name it owns, so one touch binds the group.
+_GROUPS = {}
+for _name, _module_name in _LAZY.items():
+    _GROUPS.setdefault(_module_name, []).append(_name)
+_GROUPS = MappingProxyType({k: tuple(v) for k, v in _GROUPS.items()})
+del _name, _module_name
+
+# Retired name -> (submodule, replacement name, message). Served with a
+# DeprecationWarning on first access and then cached like any other export.
+_DEPRECATED = MappingProxyType({})
+
+
+def __getattr__(name):
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        if name in _DEPRECATED:
+            return _resolve_deprecated(name)
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = import_module(f".{module_name}", __name__)
+    # Bind the submodule's whole group on the package so later lookups of any
+    # of these names bypass __getattr__ entirely.
+    namespace = globals()
+    for exported in _GROUPS[module_name]:
+        namespace[exported] = getattr(module, exported)
+    return namespace[name]
+
+
+def _resolve_deprecated(name):
+    import warnings
+
+    module_name, target, message = _DEPRECATED[name]
+    warnings.warn(message, DeprecationWarning, stacklevel=3)
+    value = getattr(import_module(f".{module_name}", __name__), target)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
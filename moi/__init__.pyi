@@ -0,0 +1,39 @@
+from ._version import __version__ as __version__
+from .client import RawClient as RawClient
+from .errors import (
+    APIError as APIError,
+    HTTPError as HTTPError,
+    ErrBaseURLRequired as ErrBaseURLRequired,
+    ErrAPIKeyRequired as ErrAPIKeyRequired,
+    ErrNilRequest as ErrNilRequest,
+)
+from .sdk_client import (
+    SDKClient as SDKClient,
+    get_client as get_client,
+    TablePrivInfo as TablePrivInfo,
+    ExistedTableOption as ExistedTableOption,
+    ExistedTableOptions as ExistedTableOptions,
+)
+from .stream import FileStream as FileStream, DataAnalysisStream as DataAnalysisStream
+from .models import (
+    DataAnalysisRequest as DataAnalysisRequest,
+    DataAnalysisConfig as DataAnalysisConfig,
+    DataAnalysisStreamEvent as DataAnalysisStreamEvent,
+    InitEventData as InitEventData,
+    DataSource as DataSource,
+    DataAskingTableConfig as DataAskingTableConfig,
+    FileConfig as FileConfig,
+    FilterConditions as FilterConditions,
+    DataScope as DataScope,
+    CodeGroup as CodeGroup,
+    QuestionType as QuestionType,
+    DedupBy as DedupBy,
+    DedupStrategy as DedupStrategy,
+    DedupConfig as DedupConfig,
+    new_dedup_config as new_dedup_config,
+    new_dedup_config_skip_by_name_and_md5 as new_dedup_config_skip_by_name_and_md5,
+    new_dedup_config_skip_by_name as new_dedup_config_skip_by_name,
+    new_dedup_config_skip_by_md5 as new_dedup_config_skip_by_md5,
+)
+
+__all__: tuple[str, ...]
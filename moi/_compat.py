@@ -0,0 +1,17 @@
+"""Compatibility helpers for the Python versions supported by the SDK."""
+
+import sys
+from dataclasses import dataclass
+
+# dataclass(slots=True) is only available on Python 3.10+.
+_DATACLASS_SLOTS = sys.version_info >= (3, 10)
+
+
+def slotted_dataclass(cls=None, **kwargs):
+    """
+    Drop-in replacement for ``@dataclass`` that also generates ``__slots__``
+    on interpreters that support it, and is a plain dataclass elsewhere.
+    """
+    if _DATACLASS_SLOTS:
+        kwargs.setdefault("slots", True)
+    return dataclass(cls, **kwargs)
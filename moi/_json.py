@@ -0,0 +1,60 @@
+"""JSON encoding helpers for the MOI SDK.
+
+Request bodies are always encoded with the standard library ``json`` module,
+so the bytes sent do not depend on which optional packages are installed.
+Values it cannot encode (enums, datetimes, ...) go through ``default``
+(``str`` unless overridden), dataclasses are serialized directly without an
+intermediate ``asdict`` copy, and ``dumps`` returns UTF-8 encoded ``bytes``.
+
+Responses are decoded with orjson when it is installed
+(``pip install moi-python-sdk[fast]``), and with ``json`` otherwise.
+"""
+
+import json
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
+from typing import Any, Callable, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this one type regardless of the backend in use.
+JSONDecodeError = json.JSONDecodeError
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(f.name for f in fields(cls))
+
+
+def _encode_default(obj: Any, fallback: Optional[Callable[[Any], Any]]) -> Any:
+    # Dataclasses are expanded one level at a time while the encoder walks
+    # the tree, instead of materializing a deep copy with asdict() first.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {name: getattr(obj, name) for name in _field_names(type(obj))}
+    if fallback is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return fallback(obj)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = str) -> bytes:
+    """Serialize obj to JSON bytes."""
+    # orjson is not used here: it encodes enums by value and datetimes as
+    # RFC 3339, where the SDK has always sent str() of them.
+    return json.dumps(obj, default=lambda o: _encode_default(o, default)).encode("utf-8")
+
+
+if orjson is not None:
+
+    def loads(data: Any) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return orjson.loads(data)
+
+else:
+
+    def loads(data: Any) -> Any:
+        """Deserialize JSON from bytes or str."""
+        return json.loads(data)
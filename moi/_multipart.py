@@ -0,0 +1,183 @@
+"""Streaming multipart/form-data bodies for file uploads.
+
+requests builds multipart bodies by reading every file fully into memory.
+``MultipartStream`` produces byte-identical output (it reuses urllib3's part
+header rendering) but reads file parts lazily while the request is being
+sent, and advertises the exact ``Content-Length`` up front. Any binary file
+object whose remaining size can be measured (disk files, ``BytesIO``,
+``mmap``) is streamed this way.
+"""
+
+import io
+import os
+import stat
+from typing import Any, Iterator, List, Mapping, Optional, Tuple, Union
+
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+_CHUNK_SIZE = 64 * 1024
+
+# A body segment is either in-memory bytes or a (file object, byte count) pair.
+_Segment = Union[bytes, Tuple[Any, int]]
+
+
+def _file_size(file_obj: Any) -> Optional[int]:
+    """Return the number of bytes left to read from file_obj, or None if unknown."""
+    if isinstance(file_obj, io.TextIOBase):
+        return None
+    try:
+        st = os.fstat(file_obj.fileno())
+        if stat.S_ISREG(st.st_mode):
+            return st.st_size - file_obj.tell()
+    except (AttributeError, OSError, ValueError):
+        pass
+    # In-memory and other seekable streams (BytesIO, mmap, ...): measure the
+    # remainder by seeking to the end and back.
+    try:
+        position = file_obj.tell()
+        file_obj.seek(0, os.SEEK_END)
+        end = file_obj.tell()
+        file_obj.seek(position)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - position
+
+
+def _iter_items(value: Any) -> List[Tuple[Any, Any]]:
+    if value is None:
+        return []
+    if isinstance(value, Mapping):
+        return list(value.items())
+    return list(value)
+
+
+class MultipartStream:
+    """
+    File-like multipart/form-data body with a known length.
+
+    Use ``MultipartStream.build`` to create one; it returns None when a file
+    part's size cannot be determined up front, in which case callers should
+    fall back to requests' own (in-memory) multipart encoding.
+    """
+
+    def __init__(self, segments: List[_Segment], boundary: str):
+        self._segments = segments
+        self._index = 0
+        self._offset = 0
+        self._length = sum(
+            len(segment) if isinstance(segment, bytes) else segment[1]
+            for segment in segments
+        )
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+
+    @classmethod
+    def build(
+        cls,
+        fields: Optional[Any],
+        files: Any,
+        boundary: Optional[str] = None,
+    ) -> Optional["MultipartStream"]:
+        """
+        Build a streaming body from requests-style ``data`` and ``files``.
+
+        Form fields come first, then files, mirroring requests' encoding.
+        """
+        boundary = boundary or choose_boundary()
+        delimiter = f"--{boundary}\r\n".encode("latin-1")
+        segments: List[_Segment] = []
+
+        def add_part(field: RequestField, payload: _Segment) -> None:
+            segments.append(delimiter + field.render_headers().encode("utf-8"))
+            segments.append(payload)
+            segments.append(b"\r\n")
+
+        for name, value in _iter_items(fields):
+            values = [value] if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__") else value
+            for item in values:
+                if item is None:
+                    continue
+                data = item if isinstance(item, bytes) else str(item).encode("utf-8")
+                field = RequestField(name=name, data=data)
+                field.make_multipart()
+                add_part(field, data)
+
+        for name, value in _iter_items(files):
+            content_type = None
+            headers = None
+            if isinstance(value, (tuple, list)):
+                if len(value) == 2:
+                    filename, file_obj = value
+                elif len(value) == 3:
+                    filename, file_obj, content_type = value
+                else:
+                    filename, file_obj, content_type, headers = value
+            else:
+                # Same filename guess as requests.utils.guess_filename.
+                guessed = getattr(value, "name", None)
+                if isinstance(guessed, str) and guessed and guessed[0] != "<" and guessed[-1] != ">":
+                    filename = os.path.basename(guessed)
+                else:
+                    filename = name
+                file_obj = value
+
+            if file_obj is None:
+                continue
+            if isinstance(file_obj, (str, bytes, bytearray)):
+                payload: _Segment = (
+                    file_obj.encode("utf-8") if isinstance(file_obj, str) else bytes(file_obj)
+                )
+            elif hasattr(file_obj, "read"):
+                size = _file_size(file_obj)
+                if size is None:
+                    return None
+                payload = (file_obj, size)
+            else:
+                return None
+
+            field = RequestField(name=name, data=b"", filename=filename, headers=headers)
+            field.make_multipart(content_type=content_type)
+            add_part(field, payload)
+
+        segments.append(f"--{boundary}--\r\n".encode("latin-1"))
+        return cls(segments, boundary)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes of the encoded body (all remaining if size < 0)."""
+        out = bytearray()
+        while self._index < len(self._segments) and (size < 0 or len(out) < size):
+            segment = self._segments[self._index]
+            want = -1 if size < 0 else size - len(out)
+            if isinstance(segment, bytes):
+                start = self._offset
+                end = len(segment) if want < 0 else min(len(segment), start + want)
+                out += segment[start:end]
+                if end == len(segment):
+                    self._index += 1
+                    self._offset = 0
+                else:
+                    self._offset = end
+                continue
+
+            file_obj, total = segment
+            left = total - self._offset
+            count = left if want < 0 else min(left, want)
+            data = file_obj.read(count) if count else b""
+            if count and not data:
+                raise OSError("file ended before its expected size during multipart upload")
+            out += data
+            self._offset += len(data)
+            if self._offset == total:
+                self._index += 1
+                self._offset = 0
+        return bytes(out)
@@ -0,0 +1,3 @@
+"""Version of the MOI Python SDK, kept apart so reading it imports nothing else."""
+
+__version__ = "0.1.0"
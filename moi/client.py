@@ -1,17 +1,131 @@
 """Core client implementation for the MOI SDK."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Optional, Any, Dict, Iterable, Tuple, IO, List
-from urllib.parse import urlparse, urljoin
+from typing import Optional, Any, Dict, Iterable, Tuple, IO, List, Union, TYPE_CHECKING
+from urllib.parse import quote, urlencode, urlparse
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+from . import _json
+from ._multipart import MultipartStream
 from .errors import ErrBaseURLRequired, ErrAPIKeyRequired, ErrNilRequest, APIError, HTTPError
 from .options import ClientOptions, CallOptions, ClientOption, CallOption
 from .response import APIEnvelope
-from .stream import FileStream, DataAnalysisStream
 
+if TYPE_CHECKING:
+    # Streaming types are imported on first use so that plain JSON calls
+    # never load moi.stream (and moi.models behind it).
+    from .stream import FileStream, DataAnalysisStream
+
+# Connection pool sizing for the session RawClient creates itself.
+_POOL_CONNECTIONS = 32
+_POOL_MAXSIZE = 64
+
+# Transient gateway errors are retried with a short backoff, for idempotent
+# methods only, so POSTs are never replayed; once retries run out the last
+# response is returned and raised as HTTPError. Connection, read and other
+# errors are not retried and surface on the first failure, as with a plain
+# requests session. Retry-After headers are ignored: a gateway asking for
+# minutes would stall the caller's thread, so the wait is always the
+# exponential backoff below (0.2s-base, three attempts, under two seconds in
+# total).
+_RETRY_STATUSES = (502, 503, 504)
+_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Request bodies (file uploads) are read and sent in blocks of this size,
+# instead of http.client's 8-16 KiB default. urllib3 1.x connections have no
+# blocksize option, so there the default is kept.
+_SEND_BLOCKSIZE = 1024 * 1024
+_URLLIB3_HAS_BLOCKSIZE = int(urllib3.__version__.split(".")[0]) >= 2
+
+
+class _PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections send request bodies in large blocks."""
+
+    def init_poolmanager(self, *args, **pool_kwargs):
+        if _URLLIB3_HAS_BLOCKSIZE:
+            pool_kwargs.setdefault("blocksize", _SEND_BLOCKSIZE)
+        super().init_poolmanager(*args, **pool_kwargs)
+
+
+def _default_retry() -> Retry:
+    return Retry(
+        total=3,
+        connect=0,
+        read=0,
+        other=0,
+        backoff_factor=0.2,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=_RETRY_METHODS,
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    )
+
+
+# Body of the parameterless list/tree/overview POSTs.
+_EMPTY_JSON_BODY = b"{}"
+
+# Streamed error responses are read up to this many bytes for HTTPError.
+_ERROR_BODY_LIMIT = 64 * 1024
+_ERROR_BODY_CHUNK = 8 * 1024
+
+# Shared result for calls without options. Nothing mutates a resolved
+# CallOptions, so one instance can serve every such call.
+_EMPTY_CALL_OPTS = CallOptions()
+
+
+def _resolve_call_opts(opts: Iterable[Optional[CallOption]]) -> CallOptions:
+    """Apply call options to a fresh CallOptions, or reuse the shared empty one."""
+    if not opts:
+        return _EMPTY_CALL_OPTS
+    call_opts = CallOptions()
+    for opt in opts:
+        if opt is not None:
+            opt(call_opts)
+    return call_opts
+
+
+def _read_error_body(response: requests.Response) -> bytes:
+    """
+    Read at most _ERROR_BODY_LIMIT bytes of a streamed error response and close it.
+
+    Error bodies are only used for HTTPError messages, so a misbehaving server
+    cannot make a failed download buffer an arbitrarily large payload.
+    """
+    try:
+        body = bytearray()
+        for chunk in response.iter_content(_ERROR_BODY_CHUNK):
+            body += chunk
+            if len(body) >= _ERROR_BODY_LIMIT:
+                del body[_ERROR_BODY_LIMIT:]
+                break
+        return bytes(body)
+    finally:
+        response.close()
+
+
+def _post_endpoint(name: str, path: str, doc: Optional[str] = None):
+    """
+    Build a RawClient method that POSTs a required JSON payload to path.
+
+    All generated methods share one code object; only the closure cells
+    (name and path) differ.
+    """
+    message = f"{name} requires a request payload"
+
+    def endpoint(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
+        if request is None:
+            raise ErrNilRequest(message)
+        return self._request_json("POST", path, request, *opts)
+
+    endpoint.__name__ = name
+    endpoint.__qualname__ = f"RawClient.{name}"
+    endpoint.__doc__ = doc
+    return endpoint
 
 class RawClient:
     """
@@ -20,6 +134,19 @@ class RawClient:
     This is a low-level client that provides direct access to API endpoints.
     For higher-level convenience methods, use SDKClient instead.
     """
+
+    __slots__ = (
+        "_http_client",
+        "_owns_http_client",
+        "_base_url",
+        "_url_root",
+        "_api_key",
+        "_user_agent",
+        "_default_headers",
+        "_timeout",
+        "_base_headers",
+        "_json_headers",
+    )
     
     def __init__(self, base_url: str, api_key: str, *opts: ClientOption):
         """
@@ -55,15 +182,32 @@ class RawClient:
         # Setup HTTP client
         if cfg.http_client is None:
             session = requests.Session()
+            adapter = cfg.http_adapter
+            if adapter is None:
+                # The default adapter keeps only 10 connections per host, which
+                # forces reconnects when many threads share one client.
+                adapter = _PooledHTTPAdapter(
+                    pool_connections=_POOL_CONNECTIONS,
+                    pool_maxsize=_POOL_MAXSIZE,
+                    max_retries=_default_retry(),
+                )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
             self._http_client = session
+            self._owns_http_client = True
         else:
             self._http_client = cfg.http_client
+            self._owns_http_client = False
         
         self._base_url = normalized
+        # Request URLs resolve absolute paths against scheme://host only
+        # (the same result urljoin gave), so plain concatenation is enough.
+        self._url_root = f"{parsed.scheme}://{parsed.netloc}"
         self._api_key = trimmed_key
         self._user_agent = cfg.user_agent
         self._default_headers = cfg.default_headers.copy()
         self._timeout = cfg.timeout
+        self._init_header_cache()
     
     def with_special_user(self, api_key: str) -> "RawClient":
         """
@@ -89,34 +233,60 @@ class RawClient:
         # Create a new client with the same configuration but different API key
         new_client = RawClient.__new__(RawClient)
         new_client._base_url = self._base_url
+        new_client._url_root = self._url_root
         new_client._api_key = trimmed_key
         new_client._http_client = self._http_client  # Share the same HTTP client (thread-safe)
+        new_client._owns_http_client = False  # The original client closes it
         new_client._user_agent = self._user_agent
         new_client._default_headers = self._default_headers.copy()  # Copy headers
         new_client._timeout = self._timeout
+        new_client._init_header_cache()
         
         return new_client
+
+    def close(self) -> None:
+        """
+        Release pooled connections held by this client.
+        
+        Only a session created by the client itself is closed; sessions passed
+        in with ``with_http_client`` and clones from ``with_special_user`` are
+        left open for their owner.
+        """
+        if self._owns_http_client:
+            self._http_client.close()
+
+    def __enter__(self) -> "RawClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _init_header_cache(self) -> None:
+        """Precompute the headers shared by every request from this client."""
+        base = self._default_headers.copy()
+        base["moi-key"] = self._api_key
+        if self._user_agent:
+            base["User-Agent"] = self._user_agent
+        self._base_headers = base
+        self._json_headers = {
+            **base,
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+        }
     
     def _build_url(self, path: str, query_params: Optional[Dict[str, Any]] = None) -> str:
         """Build a full URL from a path and optional query parameters."""
         if not path.startswith("/"):
             path = "/" + path
         
-        url = urljoin(self._base_url, path)
+        url = self._url_root + path
         
         if query_params:
-            # Convert query params to strings
-            params = {}
-            for k, v in query_params.items():
-                if v is not None:
-                    if isinstance(v, (list, tuple)):
-                        params[k] = [str(item) for item in v]
-                    else:
-                        params[k] = str(v)
-            
-            # Build query string
-            from urllib.parse import urlencode
-            query_string = urlencode(params, doseq=True)
+            # urlencode stringifies values and expands lists/tuples itself
+            query_string = urlencode(
+                [(k, v) for k, v in query_params.items() if v is not None],
+                doseq=True,
+            )
             if query_string:
                 url = f"{url}?{query_string}"
         
@@ -124,11 +294,15 @@ class RawClient:
     
     def _build_headers(self, call_opts: CallOptions, content_type: Optional[str] = None) -> Dict[str, str]:
         """Build headers for a request."""
-        headers = self._default_headers.copy()
-        headers["moi-key"] = self._api_key
-        
-        if self._user_agent:
-            headers["User-Agent"] = self._user_agent
+        if not call_opts.request_id and not call_opts.headers:
+            # Common case: no per-call overrides, reuse a prebuilt set.
+            if content_type is None:
+                return self._base_headers.copy()
+            if content_type == "application/json":
+                return self._json_headers.copy()
+
+        # Default headers, moi-key and User-Agent are already merged.
+        headers = self._base_headers.copy()
         
         if call_opts.request_id:
             headers["X-Request-ID"] = call_opts.request_id
@@ -151,8 +325,8 @@ class RawClient:
         
         # Parse envelope
         try:
-            data = response.json()
-        except json.JSONDecodeError as e:
+            data = _json.loads(response.content)
+        except _json.JSONDecodeError as e:
             raise HTTPError(response.status_code, response.content) from e
         
         envelope = APIEnvelope.from_dict(data)
@@ -173,13 +347,16 @@ class RawClient:
         if envelope.data is None or envelope.data == "null":
             return None
         
-        # Deserialize to response type if provided
-        if isinstance(envelope.data, dict):
-            return resp_type(**envelope.data)
-        elif isinstance(envelope.data, list):
-            return [resp_type(**item) if isinstance(item, dict) else item for item in envelope.data]
+        # Deserialize to response type if provided. Decoded JSON only yields
+        # plain dicts and lists, so exact type checks are enough.
+        data = envelope.data
+        data_type = type(data)
+        if data_type is dict:
+            return resp_type(**data)
+        elif data_type is list:
+            return [resp_type(**item) if type(item) is dict else item for item in data]
         else:
-            return envelope.data
+            return data
     
     def post_json(
         self,
@@ -233,23 +410,7 @@ class RawClient:
         if self is None:
             raise ValueError("sdk client is None")
         
-        # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
-        
-        # Build URL
-        url = self._build_url(path, call_opts.query_params)
-        
-        # Serialize body
-        payload = self._prepare_body(body)
-        json_body = None
-        if payload is not None:
-            json_body = json.dumps(payload, default=str)
-        
-        # Build headers
-        headers = self._build_headers(call_opts, "application/json")
+        _, url, headers, json_body = self._prepare_json_request(path, body, opts)
         
         # Make request
         response = self._http_client.request(
@@ -261,6 +422,31 @@ class RawClient:
         )
         
         return self._parse_response(response, resp_type)
+
+    def _prepare_json_request(
+        self,
+        path: str,
+        body: Optional[Any],
+        opts: Tuple[CallOption, ...],
+    ) -> Tuple[CallOptions, str, Dict[str, str], Optional[bytes]]:
+        """
+        Resolve call options and build the URL, headers and encoded body of a
+        JSON request in one step.
+        
+        Returns:
+            (call_opts, url, headers, body) where body is None when no payload
+            was given. Dataclass payloads are handled by the encoder, and bytes
+            are taken to be already-encoded JSON and sent unchanged.
+        """
+        call_opts = _resolve_call_opts(opts)
+        
+        url = self._build_url(path, call_opts.query_params)
+        headers = self._build_headers(call_opts, "application/json")
+        if body is None or type(body) is bytes:
+            json_body = body
+        else:
+            json_body = _json.dumps(body)
+        return call_opts, url, headers, json_body
     
     @staticmethod
     def _prepare_body(body: Optional[Any]) -> Optional[Any]:
@@ -275,18 +461,21 @@ class RawClient:
     def _normalize_file_items(
         file_items: Iterable[Tuple[IO[bytes], str]],
         field_name: str = "file",
-    ) -> Iterable[Tuple[str, Tuple[str, IO[bytes]]]]:
+    ) -> List[Tuple[str, Tuple[str, IO[bytes]]]]:
         """Convert (fileobj, filename) pairs to the format expected by requests."""
         normalized = []
+        append = normalized.append
         for index, item in enumerate(file_items):
+            # One combined check for the common well-formed case; the specific
+            # error is only worked out when it fails.
+            if isinstance(item, (tuple, list)) and len(item) == 2 and item[0] is not None and item[1]:
+                append((field_name, (item[1], item[0])))
+                continue
             if not isinstance(item, (tuple, list)) or len(item) != 2:
                 raise ValueError(f"file item at index {index} must be a (fileobj, filename) tuple")
-            file_obj, filename = item
-            if file_obj is None:
+            if item[0] is None:
                 raise ValueError(f"file object at index {index} cannot be None")
-            if not filename:
-                raise ValueError(f"filename at index {index} cannot be empty")
-            normalized.append((field_name, (filename, file_obj)))
+            raise ValueError(f"filename at index {index} cannot be empty")
         return normalized
 
     def _request_json(
@@ -299,6 +488,25 @@ class RawClient:
         """Internal helper to issue JSON requests without manual resp_type wiring."""
         return self._do_json(method, path, body, None, *opts)
 
+    def _post_empty(self, path: str, *opts: CallOption) -> Any:
+        """
+        POST an empty JSON object to path.
+        
+        Without call options every input is constant for this client, so the
+        cached URL, the prebuilt JSON headers and a constant body are sent as-is
+        (requests copies headers into its own mapping, so sharing is safe).
+        """
+        if opts:
+            return self._request_json("POST", path, {}, *opts)
+        response = self._http_client.request(
+            method="POST",
+            url=self._url_root + path,
+            headers=self._json_headers,
+            data=_EMPTY_JSON_BODY,
+            timeout=self._timeout
+        )
+        return self._parse_response(response)
+
     def post_multipart(
         self,
         path: str,
@@ -324,10 +532,7 @@ class RawClient:
             raise ValueError("sdk client is None")
         
         # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
         
         # Build URL
         url = self._build_url(path, call_opts.query_params)
@@ -340,15 +545,27 @@ class RawClient:
         # Prepare form data
         data = self._prepare_body(fields) or {}
         
-        # Make request
-        response = self._http_client.request(
-            method="POST",
-            url=url,
-            headers=headers,
-            data=data,
-            files=files,
-            timeout=self._timeout
-        )
+        # Stream file parts from disk when every part has a known size;
+        # otherwise let requests encode the whole body in memory.
+        body = MultipartStream.build(data, files)
+        if body is not None:
+            headers["Content-Type"] = body.content_type
+            response = self._http_client.request(
+                method="POST",
+                url=url,
+                headers=headers,
+                data=body,
+                timeout=self._timeout
+            )
+        else:
+            response = self._http_client.request(
+                method="POST",
+                url=url,
+                headers=headers,
+                data=data,
+                files=files,
+                timeout=self._timeout
+            )
         
         return self._parse_response(response, resp_type)
     
@@ -360,18 +577,22 @@ class RawClient:
         """
         Issue a raw GET request and return the response object.
         
+        The response is opened with ``stream=True`` so the body is not loaded
+        into memory up front. It holds a pooled connection until the body is
+        read to the end or the response is closed, so always close it, e.g.
+        with ``with client.get_raw(path) as response:``. A response dropped
+        after checking only ``status_code`` or ``headers`` keeps its
+        connection checked out of the pool.
+        
         Args:
             path: The API endpoint path
             *opts: Optional call configuration options
         
         Returns:
-            The raw requests.Response object
+            The raw (streaming) requests.Response object
         """
         # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
         
         # Build URL
         url = self._build_url(path, call_opts.query_params)
@@ -384,109 +605,89 @@ class RawClient:
             method="GET",
             url=url,
             headers=headers,
-            timeout=self._timeout
+            timeout=self._timeout,
+            stream=True
         )
         
         # Check HTTP status
         if not (200 <= response.status_code < 300):
-            raise HTTPError(response.status_code, response.content)
+            raise HTTPError(response.status_code, _read_error_body(response))
         
         return response
 
+    def download_to_file(
+        self,
+        path: str,
+        dest_path: Union[str, Path],
+        *opts: CallOption,
+        chunk_size: int = 1 << 20
+    ) -> int:
+        """
+        Stream a GET response body straight into a local file.
+        
+        The body is written chunk by chunk, so memory use stays at roughly
+        ``chunk_size`` regardless of the download size. Parent directories of
+        ``dest_path`` are created if needed.
+        
+        Args:
+            path: The API endpoint path
+            dest_path: Path to the output file
+            *opts: Optional call configuration options
+            chunk_size: Number of bytes to read per chunk (default 1 MiB)
+        
+        Returns:
+            Number of bytes written
+        """
+        dest = Path(dest_path)
+        written = 0
+        with self.get_raw(path, *opts) as response:
+            if dest.parent != Path("."):
+                dest.parent.mkdir(parents=True, exist_ok=True)
+            with open(dest, "wb") as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+                    written += len(chunk)
+        return written
+
     # ----------------------------------------------------------------------
     # Catalog APIs
     # ----------------------------------------------------------------------
 
-    def create_catalog(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        """Create a new catalog."""
-        if request is None:
-            raise ErrNilRequest("create_catalog requires a request payload")
-        return self._request_json("POST", "/catalog/create", request, *opts)
-
-    def delete_catalog(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        """Delete a catalog by ID."""
-        if request is None:
-            raise ErrNilRequest("delete_catalog requires a request payload")
-        return self._request_json("POST", "/catalog/delete", request, *opts)
-
-    def update_catalog(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        """Update catalog information."""
-        if request is None:
-            raise ErrNilRequest("update_catalog requires a request payload")
-        return self._request_json("POST", "/catalog/update", request, *opts)
-
-    def get_catalog(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        """Fetch catalog information by ID."""
-        if request is None:
-            raise ErrNilRequest("get_catalog requires a request payload")
-        return self._request_json("POST", "/catalog/info", request, *opts)
+    create_catalog = _post_endpoint("create_catalog", "/catalog/create", "Create a new catalog.")
+    delete_catalog = _post_endpoint("delete_catalog", "/catalog/delete", "Delete a catalog by ID.")
+    update_catalog = _post_endpoint("update_catalog", "/catalog/update", "Update catalog information.")
+    get_catalog = _post_endpoint("get_catalog", "/catalog/info", "Fetch catalog information by ID.")
 
     def list_catalogs(self, *opts: CallOption) -> Any:
         """List all catalogs."""
-        return self._request_json("POST", "/catalog/list", {}, *opts)
+        return self._post_empty("/catalog/list", *opts)
 
     def get_catalog_tree(self, *opts: CallOption) -> Any:
         """Retrieve the hierarchical catalog tree."""
-        return self._request_json("POST", "/catalog/tree", {}, *opts)
+        return self._post_empty("/catalog/tree", *opts)
 
-    def get_catalog_ref_list(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        """List objects referencing the specified catalog."""
-        if request is None:
-            raise ErrNilRequest("get_catalog_ref_list requires a request payload")
-        return self._request_json("POST", "/catalog/ref_list", request, *opts)
+    get_catalog_ref_list = _post_endpoint(
+        "get_catalog_ref_list", "/catalog/ref_list", "List objects referencing the specified catalog."
+    )
 
     # ----------------------------------------------------------------------
     # Database APIs
     # ----------------------------------------------------------------------
 
-    def create_database(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_database requires a request payload")
-        return self._request_json("POST", "/catalog/database/create", request, *opts)
-
-    def delete_database(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_database requires a request payload")
-        return self._request_json("POST", "/catalog/database/delete", request, *opts)
-
-    def update_database(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_database requires a request payload")
-        return self._request_json("POST", "/catalog/database/update", request, *opts)
-
-    def get_database(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_database requires a request payload")
-        return self._request_json("POST", "/catalog/database/info", request, *opts)
-
-    def list_databases(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_databases requires a request payload")
-        return self._request_json("POST", "/catalog/database/list", request, *opts)
-
-    def get_database_children(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_database_children requires a request payload")
-        return self._request_json("POST", "/catalog/database/children", request, *opts)
-
-    def get_database_ref_list(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_database_ref_list requires a request payload")
-        return self._request_json("POST", "/catalog/database/ref_list", request, *opts)
+    create_database = _post_endpoint("create_database", "/catalog/database/create")
+    delete_database = _post_endpoint("delete_database", "/catalog/database/delete")
+    update_database = _post_endpoint("update_database", "/catalog/database/update")
+    get_database = _post_endpoint("get_database", "/catalog/database/info")
+    list_databases = _post_endpoint("list_databases", "/catalog/database/list")
+    get_database_children = _post_endpoint("get_database_children", "/catalog/database/children")
+    get_database_ref_list = _post_endpoint("get_database_ref_list", "/catalog/database/ref_list")
 
     # ----------------------------------------------------------------------
     # Table APIs
     # ----------------------------------------------------------------------
 
-    def create_table(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_table requires a request payload")
-        return self._request_json("POST", "/catalog/table/create", request, *opts)
-
-    def get_table(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_table requires a request payload")
-        return self._request_json("POST", "/catalog/table/info", request, *opts)
+    create_table = _post_endpoint("create_table", "/catalog/table/create")
+    get_table = _post_endpoint("get_table", "/catalog/table/info")
 
     def get_multi_table(self, request: Optional[List[Dict[str, Any]]], *opts: CallOption) -> Any:
         if request is None:
@@ -496,12 +697,9 @@ class RawClient:
         return resp["info_map"]
 
     def get_table_overview(self, *opts: CallOption) -> Any:
-        return self._request_json("POST", "/catalog/table/overview", {}, *opts)
+        return self._post_empty("/catalog/table/overview", *opts)
 
-    def check_table_exists(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("check_table_exists requires a request payload")
-        return self._request_json("POST", "/catalog/table/exist", request, *opts)
+    check_table_exists = _post_endpoint("check_table_exists", "/catalog/table/exist")
 
     def preview_table(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
         """
@@ -555,20 +753,9 @@ class RawClient:
             "data": preview_data,
         }
 
-    def get_table_data(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_table_data requires a request payload")
-        return self._request_json("POST", "/catalog/table/data", request, *opts)
-
-    def load_table(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("load_table requires a request payload")
-        return self._request_json("POST", "/catalog/table/load", request, *opts)
-
-    def get_table_download_link(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_table_download_link requires a request payload")
-        return self._request_json("POST", "/catalog/table/download", request, *opts)
+    get_table_data = _post_endpoint("get_table_data", "/catalog/table/data")
+    load_table = _post_endpoint("load_table", "/catalog/table/load")
+    get_table_download_link = _post_endpoint("get_table_download_link", "/catalog/table/download")
 
     def download_table_data(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> "FileStream":
         """
@@ -603,21 +790,9 @@ class RawClient:
         if table_id is None:
             raise ValueError("id is required in request")
         
-        # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
-        
-        # Build URL
-        path = "/catalog/table/download_data"
-        url = self._build_url(path, call_opts.query_params)
-        
-        # Build headers
-        headers = self._build_headers(call_opts, "application/json")
-        
-        # Serialize body
-        payload = json.dumps({"id": table_id}, default=str)
+        _, url, headers, payload = self._prepare_json_request(
+            "/catalog/table/download_data", {"id": table_id}, opts
+        )
         
         # Use HTTP client with no timeout for downloading large files
         # The download can still be cancelled via context if needed
@@ -642,158 +817,54 @@ class RawClient:
         
         # Check for HTTP errors
         if not (200 <= response.status_code < 300):
-            body = response.content
-            response.close()
-            raise HTTPError(response.status_code, body)
+            raise HTTPError(response.status_code, _read_error_body(response))
         
-        return FileStream(response)
+        from .stream import FileStream
 
-    def truncate_table(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("truncate_table requires a request payload")
-        return self._request_json("POST", "/catalog/table/truncate", request, *opts)
-
-    def delete_table(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_table requires a request payload")
-        return self._request_json("POST", "/catalog/table/delete", request, *opts)
-
-    def get_table_full_path(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_table_full_path requires a request payload")
-        return self._request_json("POST", "/catalog/table/full_path", request, *opts)
+        return FileStream(response)
 
-    def get_table_ref_list(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_table_ref_list requires a request payload")
-        return self._request_json("POST", "/catalog/table/ref_list", request, *opts)
+    truncate_table = _post_endpoint("truncate_table", "/catalog/table/truncate")
+    delete_table = _post_endpoint("delete_table", "/catalog/table/delete")
+    get_table_full_path = _post_endpoint("get_table_full_path", "/catalog/table/full_path")
+    get_table_ref_list = _post_endpoint("get_table_ref_list", "/catalog/table/ref_list")
 
     # ----------------------------------------------------------------------
     # Volume APIs
     # ----------------------------------------------------------------------
 
-    def create_volume(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_volume requires a request payload")
-        return self._request_json("POST", "/catalog/volume/create", request, *opts)
-
-    def delete_volume(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_volume requires a request payload")
-        return self._request_json("POST", "/catalog/volume/delete", request, *opts)
-
-    def update_volume(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_volume requires a request payload")
-        return self._request_json("POST", "/catalog/volume/update", request, *opts)
-
-    def get_volume(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_volume requires a request payload")
-        return self._request_json("POST", "/catalog/volume/info", request, *opts)
-
-    def get_volume_ref_list(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_volume_ref_list requires a request payload")
-        return self._request_json("POST", "/catalog/volume/ref_list", request, *opts)
-
-    def get_volume_full_path(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_volume_full_path requires a request payload")
-        return self._request_json("POST", "/catalog/volume/full_path", request, *opts)
-
-    def add_volume_workflow_ref(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("add_volume_workflow_ref requires a request payload")
-        return self._request_json("POST", "/catalog/volume/add_ref_workflow", request, *opts)
-
-    def remove_volume_workflow_ref(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("remove_volume_workflow_ref requires a request payload")
-        return self._request_json("POST", "/catalog/volume/remove_ref_workflow", request, *opts)
+    create_volume = _post_endpoint("create_volume", "/catalog/volume/create")
+    delete_volume = _post_endpoint("delete_volume", "/catalog/volume/delete")
+    update_volume = _post_endpoint("update_volume", "/catalog/volume/update")
+    get_volume = _post_endpoint("get_volume", "/catalog/volume/info")
+    get_volume_ref_list = _post_endpoint("get_volume_ref_list", "/catalog/volume/ref_list")
+    get_volume_full_path = _post_endpoint("get_volume_full_path", "/catalog/volume/full_path")
+    add_volume_workflow_ref = _post_endpoint("add_volume_workflow_ref", "/catalog/volume/add_ref_workflow")
+    remove_volume_workflow_ref = _post_endpoint("remove_volume_workflow_ref", "/catalog/volume/remove_ref_workflow")
 
     # ----------------------------------------------------------------------
     # File APIs
     # ----------------------------------------------------------------------
 
-    def create_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_file requires a request payload")
-        return self._request_json("POST", "/catalog/file/create", request, *opts)
-
-    def update_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_file requires a request payload")
-        return self._request_json("POST", "/catalog/file/update", request, *opts)
-
-    def delete_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_file requires a request payload")
-        return self._request_json("POST", "/catalog/file/delete", request, *opts)
-
-    def delete_file_ref(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_file_ref requires a request payload")
-        return self._request_json("POST", "/catalog/file/delete_ref", request, *opts)
-
-    def get_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_file requires a request payload")
-        return self._request_json("POST", "/catalog/file/info", request, *opts)
-
-    def list_files(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_files requires a request payload")
-        return self._request_json("POST", "/catalog/file/list", request, *opts)
-
-    def upload_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("upload_file requires a request payload")
-        return self._request_json("POST", "/catalog/file/upload", request, *opts)
-
-    def get_file_download_link(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_file_download_link requires a request payload")
-        return self._request_json("POST", "/catalog/file/download", request, *opts)
-
-    def get_file_preview_link(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_file_preview_link requires a request payload")
-        return self._request_json("POST", "/catalog/file/preview_link", request, *opts)
-
-    def get_file_preview_stream(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_file_preview_stream requires a request payload")
-        return self._request_json("POST", "/catalog/file/preview_stream", request, *opts)
+    create_file = _post_endpoint("create_file", "/catalog/file/create")
+    update_file = _post_endpoint("update_file", "/catalog/file/update")
+    delete_file = _post_endpoint("delete_file", "/catalog/file/delete")
+    delete_file_ref = _post_endpoint("delete_file_ref", "/catalog/file/delete_ref")
+    get_file = _post_endpoint("get_file", "/catalog/file/info")
+    list_files = _post_endpoint("list_files", "/catalog/file/list")
+    upload_file = _post_endpoint("upload_file", "/catalog/file/upload")
+    get_file_download_link = _post_endpoint("get_file_download_link", "/catalog/file/download")
+    get_file_preview_link = _post_endpoint("get_file_preview_link", "/catalog/file/preview_link")
+    get_file_preview_stream = _post_endpoint("get_file_preview_stream", "/catalog/file/preview_stream")
 
     # ----------------------------------------------------------------------
     # Folder APIs
     # ----------------------------------------------------------------------
 
-    def create_folder(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_folder requires a request payload")
-        return self._request_json("POST", "/catalog/folder/create", request, *opts)
-
-    def update_folder(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_folder requires a request payload")
-        return self._request_json("POST", "/catalog/folder/update", request, *opts)
-
-    def delete_folder(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_folder requires a request payload")
-        return self._request_json("POST", "/catalog/folder/delete", request, *opts)
-
-    def clean_folder(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("clean_folder requires a request payload")
-        return self._request_json("POST", "/catalog/folder/clean", request, *opts)
-
-    def get_folder_ref_list(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_folder_ref_list requires a request payload")
-        return self._request_json("POST", "/catalog/folder/ref_list", request, *opts)
+    create_folder = _post_endpoint("create_folder", "/catalog/folder/create")
+    update_folder = _post_endpoint("update_folder", "/catalog/folder/update")
+    delete_folder = _post_endpoint("delete_folder", "/catalog/folder/delete")
+    clean_folder = _post_endpoint("clean_folder", "/catalog/folder/clean")
+    get_folder_ref_list = _post_endpoint("get_folder_ref_list", "/catalog/folder/ref_list")
 
     # ----------------------------------------------------------------------
     # Connector APIs (file upload + preview)
@@ -804,6 +875,7 @@ class RawClient:
         file_items: Iterable[Tuple[IO[bytes], str]],
         meta: Iterable[Dict[str, Any]],
         *opts: CallOption,
+        max_workers: Optional[int] = None,
     ) -> Any:
         """
         Upload multiple local files to connector temporary storage.
@@ -811,20 +883,38 @@ class RawClient:
         Args:
             file_items: Iterable of (fileobj, filename) tuples.
             meta: Iterable of metadata dicts, one per file, matching connector requirements.
+            max_workers: When greater than 1, upload each file in its own request
+                using up to this many threads. meta must then hold exactly one
+                entry per file, and a list of per-file responses is returned in
+                input order. By default all files go in a single request.
         """
         file_list = list(file_items or [])
         if not file_list:
             raise ValueError("upload_local_files requires at least one file item")
         if not meta:
             raise ValueError("meta is required for upload_local_files")
-        files_payload = list(self._normalize_file_items(file_list))
-        fields = {"meta": json.dumps(list(meta))}
-        return self.post_multipart(
-            "/connectors/file/upload",
-            files=files_payload,
-            fields=fields,
-            *opts,
-        )
+        files_payload = self._normalize_file_items(file_list)
+        meta_list = list(meta)
+        
+        if max_workers is not None and max_workers > 1 and len(files_payload) > 1:
+            if len(meta_list) != len(files_payload):
+                raise ValueError("meta must contain one entry per file when max_workers is set")
+            
+            def upload_one(index: int) -> Any:
+                return self.post_multipart(
+                    "/connectors/file/upload",
+                    [files_payload[index]],
+                    {"meta": _json.dumps([meta_list[index]])},
+                    None,
+                    *opts,
+                )
+            
+            workers = min(max_workers, len(files_payload))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(upload_one, range(len(files_payload))))
+        
+        fields = {"meta": _json.dumps(meta_list)}
+        return self.post_multipart("/connectors/file/upload", files_payload, fields, None, *opts)
 
     def upload_local_file(
         self,
@@ -849,11 +939,11 @@ class RawClient:
         with path.open("rb") as handle:
             return self.upload_local_file(handle, path.name, meta, *opts)
 
-    def preview_connector_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        """Preview a connector/local uploaded file to derive schema details."""
-        if request is None:
-            raise ErrNilRequest("preview_connector_file requires a request payload")
-        return self._request_json("POST", "/connectors/file/preview", request, *opts)
+    preview_connector_file = _post_endpoint(
+        "preview_connector_file",
+        "/connectors/file/preview",
+        "Preview a connector/local uploaded file to derive schema details.",
+    )
 
     def upload_connector_file(
         self,
@@ -881,21 +971,21 @@ class RawClient:
 
         files_payload = []
         if file_items:
-            files_payload = list(self._normalize_file_items(file_items))
+            files_payload = self._normalize_file_items(file_items)
 
         fields: Dict[str, Any] = {"VolumeID": str(volume_id)}
         if meta:
-            fields["meta"] = json.dumps(list(meta))
+            fields["meta"] = _json.dumps(list(meta))
         if file_types:
-            fields["file_types"] = json.dumps(list(file_types))
+            fields["file_types"] = _json.dumps(list(file_types))
         if path_regex:
             fields["path_regex"] = path_regex
         if unzip_keep_structure:
             fields["unzip_keep_structure"] = "true"
         if dedup_config:
-            fields["dedup"] = json.dumps(dedup_config)
+            fields["dedup"] = _json.dumps(dedup_config)
         if table_config:
-            fields["table_config"] = json.dumps(table_config)
+            fields["table_config"] = _json.dumps(table_config)
         if extra_fields:
             fields.update(extra_fields)
 
@@ -903,7 +993,7 @@ class RawClient:
         # requests requires a non-empty files dict to set multipart content-type.
         files_arg = files_payload if files_payload else {"__empty": ("", b"")}
         # Use positional arguments to avoid conflicting with *opts when callers pass None.
-        return self.post_multipart("/connectors/upload", files_arg, fields, *opts)
+        return self.post_multipart("/connectors/upload", files_arg, fields, None, *opts)
 
     def download_connector_file(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
         if request is None:
@@ -955,45 +1045,14 @@ class RawClient:
     # User APIs
     # ----------------------------------------------------------------------
 
-    def create_user(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_user requires a request payload")
-        return self._request_json("POST", "/user/create", request, *opts)
-
-    def delete_user(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_user requires a request payload")
-        return self._request_json("POST", "/user/delete", request, *opts)
-
-    def get_user_detail(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_user_detail requires a request payload")
-        return self._request_json("POST", "/user/detail_info", request, *opts)
-
-    def list_users(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_users requires a request payload")
-        return self._request_json("POST", "/user/list", request, *opts)
-
-    def update_user_password(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_user_password requires a request payload")
-        return self._request_json("POST", "/user/update_password", request, *opts)
-
-    def update_user_info(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_user_info requires a request payload")
-        return self._request_json("POST", "/user/update_info", request, *opts)
-
-    def update_user_roles(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_user_roles requires a request payload")
-        return self._request_json("POST", "/user/update_role_list", request, *opts)
-
-    def update_user_status(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_user_status requires a request payload")
-        return self._request_json("POST", "/user/update_status", request, *opts)
+    create_user = _post_endpoint("create_user", "/user/create")
+    delete_user = _post_endpoint("delete_user", "/user/delete")
+    get_user_detail = _post_endpoint("get_user_detail", "/user/detail_info")
+    list_users = _post_endpoint("list_users", "/user/list")
+    update_user_password = _post_endpoint("update_user_password", "/user/update_password")
+    update_user_info = _post_endpoint("update_user_info", "/user/update_info")
+    update_user_roles = _post_endpoint("update_user_roles", "/user/update_role_list")
+    update_user_status = _post_endpoint("update_user_status", "/user/update_status")
 
     def get_my_api_key(self, *opts: CallOption) -> Any:
         return self._request_json("POST", "/user/me/api-key", None, *opts)
@@ -1004,73 +1063,30 @@ class RawClient:
     def get_my_info(self, *opts: CallOption) -> Any:
         return self._request_json("POST", "/user/me/info", None, *opts)
 
-    def update_my_info(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_my_info requires a request payload")
-        return self._request_json("POST", "/user/me/update_info", request, *opts)
-
-    def update_my_password(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_my_password requires a request payload")
-        return self._request_json("POST", "/user/me/update_password", request, *opts)
+    update_my_info = _post_endpoint("update_my_info", "/user/me/update_info")
+    update_my_password = _post_endpoint("update_my_password", "/user/me/update_password")
 
     # ----------------------------------------------------------------------
     # Role APIs
     # ----------------------------------------------------------------------
 
-    def create_role(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_role requires a request payload")
-        return self._request_json("POST", "/role/create", request, *opts)
-
-    def delete_role(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_role requires a request payload")
-        return self._request_json("POST", "/role/delete", request, *opts)
-
-    def get_role(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_role requires a request payload")
-        return self._request_json("POST", "/role/info", request, *opts)
-
-    def list_roles(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_roles requires a request payload")
-        return self._request_json("POST", "/role/list", request, *opts)
-
-    def list_roles_by_category_and_object(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_roles_by_category_and_object requires a request payload")
-        return self._request_json("POST", "/role/list_by_category_and_obj", request, *opts)
-
-    def update_role_code_list(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_role_code_list requires a request payload")
-        return self._request_json("POST", "/role/update_code_list", request, *opts)
-
-    def update_role_info(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_role_info requires a request payload")
-        return self._request_json("POST", "/role/update_info", request, *opts)
-
-    def update_roles_by_object(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_roles_by_object requires a request payload")
-        return self._request_json("POST", "/role/update_roles_by_obj", request, *opts)
-
-    def update_role_status(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_role_status requires a request payload")
-        return self._request_json("POST", "/role/update_status", request, *opts)
+    create_role = _post_endpoint("create_role", "/role/create")
+    delete_role = _post_endpoint("delete_role", "/role/delete")
+    get_role = _post_endpoint("get_role", "/role/info")
+    list_roles = _post_endpoint("list_roles", "/role/list")
+    list_roles_by_category_and_object = _post_endpoint(
+        "list_roles_by_category_and_object", "/role/list_by_category_and_obj"
+    )
+    update_role_code_list = _post_endpoint("update_role_code_list", "/role/update_code_list")
+    update_role_info = _post_endpoint("update_role_info", "/role/update_info")
+    update_roles_by_object = _post_endpoint("update_roles_by_object", "/role/update_roles_by_obj")
+    update_role_status = _post_endpoint("update_role_status", "/role/update_status")
 
     # ----------------------------------------------------------------------
     # Privilege APIs
     # ----------------------------------------------------------------------
 
-    def list_objects_by_category(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_objects_by_category requires a request payload")
-        return self._request_json("POST", "/rbac/priv/list_obj_by_category", request, *opts)
+    list_objects_by_category = _post_endpoint("list_objects_by_category", "/rbac/priv/list_obj_by_category")
 
     # ----------------------------------------------------------------------
     # GenAI APIs
@@ -1085,12 +1101,12 @@ class RawClient:
         if file_items:
             if request is None:
                 raise ErrNilRequest("create_genai_pipeline requires a request payload when uploading files")
-            payload = json.dumps(request, default=str)
+            payload = _json.dumps(request)
             fields: Dict[str, Any] = {"payload": payload}
             if "file_names" in request and request["file_names"]:
-                fields["file_names"] = json.dumps(request["file_names"])
-            files_payload = list(self._normalize_file_items(file_items, field_name="files"))
-            return self.post_multipart("/v1/genai/pipeline", files=files_payload, fields=fields, *opts)
+                fields["file_names"] = _json.dumps(request["file_names"])
+            files_payload = self._normalize_file_items(file_items, field_name="files")
+            return self.post_multipart("/v1/genai/pipeline", files_payload, fields, None, *opts)
 
         if request is None:
             raise ErrNilRequest("create_genai_pipeline requires a request payload")
@@ -1102,14 +1118,39 @@ class RawClient:
         path = f"/v1/genai/jobs/{job_id}"
         return self._request_json("GET", path, None, *opts)
 
-    def download_genai_result(self, file_id: str, *opts: CallOption) -> FileStream:
+    def get_genai_jobs(
+        self,
+        job_ids: Iterable[str],
+        *opts: CallOption,
+        max_workers: int = 8,
+    ) -> List[Any]:
+        """
+        Fetch several GenAI jobs concurrently.
+        
+        Each job is requested with ``get_genai_job`` on up to ``max_workers``
+        threads sharing this client's connection pool, so polling N jobs costs
+        roughly one round trip instead of N. Results are returned in input order;
+        the first failing request's exception is raised.
+        
+        Args:
+            job_ids: Job IDs to fetch
+            *opts: Optional call configuration options applied to every request
+            max_workers: Maximum number of concurrent requests (default 8)
+        """
+        id_list = list(job_ids)
+        if any(not job_id for job_id in id_list):
+            raise ValueError("job_id cannot be empty")
+        if len(id_list) <= 1 or max_workers <= 1:
+            return [self.get_genai_job(job_id, *opts) for job_id in id_list]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(id_list))) as executor:
+            return list(executor.map(lambda job_id: self.get_genai_job(job_id, *opts), id_list))
+
+    def download_genai_result(self, file_id: str, *opts: CallOption) -> "FileStream":
         if not file_id:
             raise ValueError("file_id cannot be empty")
 
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
 
         path = f"/v1/genai/results/file/{file_id}"
         url = self._build_url(path, call_opts.query_params)
@@ -1124,9 +1165,9 @@ class RawClient:
         )
 
         if not (200 <= response.status_code < 300):
-            body = response.content
-            response.close()
-            raise HTTPError(response.status_code, body)
+            raise HTTPError(response.status_code, _read_error_body(response))
+
+        from .stream import FileStream
 
         return FileStream(response)
 
@@ -1257,10 +1298,7 @@ class RawClient:
             opts_list.append(with_query_param("page_size", str(request["page_size"])))
         
         # Make GET request
-        call_opts = CallOptions()
-        for opt in opts_list:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts_list)
         
         path = "/byoa/api/v1/workflow_job"
         url = self._build_url(path, call_opts.query_params)
@@ -1319,67 +1357,30 @@ class RawClient:
     # NL2SQL APIs
     # ----------------------------------------------------------------------
 
-    def run_nl2sql(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("run_nl2sql requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql/run_sql", request, *opts)
-
-    def create_knowledge(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("create_knowledge requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql_knowledge/create", request, *opts)
-
-    def update_knowledge(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("update_knowledge requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql_knowledge/update", request, *opts)
-
-    def delete_knowledge(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("delete_knowledge requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql_knowledge/delete", request, *opts)
-
-    def get_knowledge(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("get_knowledge requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql_knowledge/get", request, *opts)
-
-    def list_knowledge(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_knowledge requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql_knowledge/list", request, *opts)
-
-    def search_knowledge(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("search_knowledge requires a request payload")
-        return self._request_json("POST", "/catalog/nl2sql_knowledge/search", request, *opts)
+    run_nl2sql = _post_endpoint("run_nl2sql", "/catalog/nl2sql/run_sql")
+    create_knowledge = _post_endpoint("create_knowledge", "/catalog/nl2sql_knowledge/create")
+    update_knowledge = _post_endpoint("update_knowledge", "/catalog/nl2sql_knowledge/update")
+    delete_knowledge = _post_endpoint("delete_knowledge", "/catalog/nl2sql_knowledge/delete")
+    get_knowledge = _post_endpoint("get_knowledge", "/catalog/nl2sql_knowledge/get")
+    list_knowledge = _post_endpoint("list_knowledge", "/catalog/nl2sql_knowledge/list")
+    search_knowledge = _post_endpoint("search_knowledge", "/catalog/nl2sql_knowledge/search")
 
     # ----------------------------------------------------------------------
     # Health + Log APIs
     # ----------------------------------------------------------------------
 
     def health_check(self, *opts: CallOption) -> Any:
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
 
         url = self._build_url("/healthz", call_opts.query_params)
         headers = self._build_headers(call_opts)
         response = self._http_client.request("GET", url=url, headers=headers, timeout=self._timeout)
         if not (200 <= response.status_code < 300):
             raise HTTPError(response.status_code, response.content)
-        return response.json()
-
-    def list_user_logs(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_user_logs requires a request payload")
-        return self._request_json("POST", "/log/user", request, *opts)
+        return _json.loads(response.content)
 
-    def list_role_logs(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
-        if request is None:
-            raise ErrNilRequest("list_role_logs requires a request payload")
-        return self._request_json("POST", "/log/role", request, *opts)
+    list_user_logs = _post_endpoint("list_user_logs", "/log/user")
+    list_role_logs = _post_endpoint("list_role_logs", "/log/role")
 
     # ----------------------------------------------------------------------
     # LLM Proxy APIs
@@ -1400,23 +1401,9 @@ class RawClient:
         if self is None:
             raise ValueError("sdk client is None")
         
-        # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
-        
         # Build full URL with /llm-proxy prefix
         full_path = "/llm-proxy" + (path if path.startswith("/") else "/" + path)
-        url = self._build_url(full_path, call_opts.query_params)
-        
-        # Serialize body
-        json_body = None
-        if body is not None:
-            json_body = json.dumps(body, default=str)
-        
-        # Build headers
-        headers = self._build_headers(call_opts, "application/json")
+        _, url, headers, json_body = self._prepare_json_request(full_path, body, opts)
         
         # Make request
         response = self._http_client.request(
@@ -1432,7 +1419,7 @@ class RawClient:
         # Check for error response format
         if response.status_code >= 400:
             try:
-                err_data = response.json()
+                err_data = _json.loads(data)
                 if isinstance(err_data, dict) and "error" in err_data:
                     error_info = err_data["error"]
                     raise APIError(
@@ -1440,7 +1427,7 @@ class RawClient:
                         message=error_info.get("message", ""),
                         http_status=response.status_code
                     )
-            except (json.JSONDecodeError, KeyError):
+            except (_json.JSONDecodeError, KeyError):
                 pass
             # If not in error format, return HTTP error
             raise HTTPError(response.status_code, data)
@@ -1448,8 +1435,8 @@ class RawClient:
         # Parse successful response
         if len(data) > 0 and data != b"null":
             try:
-                return response.json()
-            except json.JSONDecodeError:
+                return _json.loads(data)
+            except _json.JSONDecodeError:
                 return data.decode('utf-8') if isinstance(data, bytes) else data
         return None
 
@@ -1643,10 +1630,7 @@ class RawClient:
             raise ValueError("sdk client is None")
         
         # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
         
         # Build full URL with /llm-proxy prefix
         full_path = f"/llm-proxy/api/sessions/{session_id}/messages/{message_id}/modify-response"
@@ -1672,7 +1656,7 @@ class RawClient:
         # Check for error response format
         if response.status_code >= 400:
             try:
-                err_data = response.json()
+                err_data = _json.loads(data)
                 if isinstance(err_data, dict) and "error" in err_data:
                     error_info = err_data["error"]
                     raise APIError(
@@ -1680,7 +1664,7 @@ class RawClient:
                         message=error_info.get("message", ""),
                         http_status=response.status_code
                     )
-            except (json.JSONDecodeError, ValueError):
+            except (_json.JSONDecodeError, ValueError):
                 pass
             # If not in error format, return HTTP error
             raise HTTPError(response.status_code, data)
@@ -1688,8 +1672,8 @@ class RawClient:
         # Parse successful response
         if len(data) > 0 and data != b"null":
             try:
-                return response.json()
-            except json.JSONDecodeError:
+                return _json.loads(data)
+            except _json.JSONDecodeError:
                 return data.decode('utf-8') if isinstance(data, bytes) else data
         return None
 
@@ -1717,10 +1701,7 @@ class RawClient:
             raise ValueError("sdk client is None")
         
         # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
         
         # Build full URL with /llm-proxy prefix
         full_path = f"/llm-proxy/api/sessions/{session_id}/messages/{message_id}/append-modified-response"
@@ -1746,7 +1727,7 @@ class RawClient:
         # Check for error response format
         if response.status_code >= 400:
             try:
-                err_data = response.json()
+                err_data = _json.loads(data)
                 if isinstance(err_data, dict) and "error" in err_data:
                     error_info = err_data["error"]
                     raise APIError(
@@ -1754,7 +1735,7 @@ class RawClient:
                         message=error_info.get("message", ""),
                         http_status=response.status_code
                     )
-            except (json.JSONDecodeError, ValueError):
+            except (_json.JSONDecodeError, ValueError):
                 pass
             # If not in error format, return HTTP error
             raise HTTPError(response.status_code, data)
@@ -1762,8 +1743,8 @@ class RawClient:
         # Parse successful response
         if len(data) > 0 and data != b"null":
             try:
-                return response.json()
-            except json.JSONDecodeError:
+                return _json.loads(data)
+            except _json.JSONDecodeError:
                 return data.decode('utf-8') if isinstance(data, bytes) else data
         return None
 
@@ -1865,7 +1846,6 @@ class RawClient:
         Example:
             client.delete_llm_chat_message_tag(1, "my-app", "tag1")
         """
-        from urllib.parse import quote
         path = f"/api/chat-messages/{message_id}/tags/{quote(source)}/{quote(name)}"
         return self._do_llm_json("DELETE", path, None, *opts)
 
@@ -1877,7 +1857,7 @@ class RawClient:
         self,
         request: Optional[Dict[str, Any]],
         *opts: CallOption
-    ) -> DataAnalysisStream:
+    ) -> "DataAnalysisStream":
         """
         Perform data analysis and return a streaming response.
         
@@ -1930,22 +1910,9 @@ class RawClient:
         if not question:
             raise ValueError("question cannot be empty")
         
-        # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
-        
-        # Build URL
-        path = "/byoa/api/v1/data_asking/analyze"
-        url = self._build_url(path, call_opts.query_params)
-        
-        # Serialize body
-        payload = self._prepare_body(request)
-        json_body = json.dumps(payload, default=str)
-        
-        # Build headers
-        headers = self._build_headers(call_opts, "application/json")
+        call_opts, url, headers, json_body = self._prepare_json_request(
+            "/byoa/api/v1/data_asking/analyze", request, opts
+        )
         # Override Accept header for SSE
         headers["Accept"] = "text/event-stream"
         
@@ -1961,18 +1928,17 @@ class RawClient:
         
         # Check for HTTP errors
         if not (200 <= response.status_code < 300):
-            body = response.content
-            response.close()
-            raise HTTPError(response.status_code, body)
+            raise HTTPError(response.status_code, _read_error_body(response))
         
         # Check content type
         content_type = response.headers.get("Content-Type", "")
         if "text/event-stream" not in content_type and "text/plain" not in content_type:
             # Not a streaming response, try to parse as error
-            body = response.content
-            response.close()
+            body = _read_error_body(response)
             raise ValueError(f"unexpected content type: {content_type}, body: {body.decode('utf-8', errors='ignore')}")
         
+        from .stream import DataAnalysisStream
+
         return DataAnalysisStream(response, initial_buffer_size=call_opts.stream_buffer_size)
 
     def cancel_analyze(self, request: Optional[Dict[str, Any]], *opts: CallOption) -> Any:
@@ -2010,10 +1976,7 @@ class RawClient:
         opts = list(opts) + [with_query_param("request_id", request_id)]
         
         # Build call options
-        call_opts = CallOptions()
-        for opt in opts:
-            if opt is not None:
-                opt(call_opts)
+        call_opts = _resolve_call_opts(opts)
         
         # Build URL
         path = "/byoa/api/v1/data_asking/cancel"
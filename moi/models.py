@@ -11,10 +11,12 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict, Any
 
+from ._compat import slotted_dataclass
+
 # ============ Infra: Filter types ============
 
 
-@dataclass
+@slotted_dataclass
 class CommonFilter:
     name: str
     values: List[str] = field(default_factory=list)
@@ -22,7 +24,7 @@ class CommonFilter:
     filter_values: List[Any] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class CommonCondition:
     page: int = 1
     page_size: int = 20
@@ -70,7 +72,7 @@ RoleIDNotFound = 4294967295
 UserIDNotFound = 4294967295
 
 
-@dataclass
+@slotted_dataclass
 class FullPath:
     id_list: List[str] = field(default_factory=list)
     name_list: List[str] = field(default_factory=list)
@@ -96,32 +98,41 @@ class ObjType(Enum):
     SUBSCRIPTION = 16  # 订阅操作
 
     def __str__(self) -> str:  # pragma: no cover - trivial
-        mapping = {
-            ObjType.CONNECTOR: "connector",
-            ObjType.LOAD_TASK: "load_task",
-            ObjType.WORKFLOW: "workflow",
-            ObjType.VOLUME: "volume",
-            ObjType.DATASET: "dataset",
-            ObjType.ALARM: "alarm",
-            ObjType.USER: "user",
-            ObjType.ROLE: "role",
-            ObjType.EXPORT_TASK: "export_task",
-            ObjType.DATA_CENTER: "data_center",
-            ObjType.CATALOG: "catalog",
-            ObjType.DATABASE: "database",
-            ObjType.TABLE: "table",
-            ObjType.KNOWLEDGE: "knowledge",
-            ObjType.PUBLICATION: "publication",
-            ObjType.SUBSCRIPTION: "subscription",
-        }
-        return mapping.get(self, "none")
-
-
-@dataclass
+        return _OBJTYPE_NAMES.get(self, "none")
+
+
+# Built once at import instead of on every ObjType.__str__ call.
+_OBJTYPE_NAMES: Dict[ObjType, str] = {
+    ObjType.CONNECTOR: "connector",
+    ObjType.LOAD_TASK: "load_task",
+    ObjType.WORKFLOW: "workflow",
+    ObjType.VOLUME: "volume",
+    ObjType.DATASET: "dataset",
+    ObjType.ALARM: "alarm",
+    ObjType.USER: "user",
+    ObjType.ROLE: "role",
+    ObjType.EXPORT_TASK: "export_task",
+    ObjType.DATA_CENTER: "data_center",
+    ObjType.CATALOG: "catalog",
+    ObjType.DATABASE: "database",
+    ObjType.TABLE: "table",
+    ObjType.KNOWLEDGE: "knowledge",
+    ObjType.PUBLICATION: "publication",
+    ObjType.SUBSCRIPTION: "subscription",
+}
+
+
+@slotted_dataclass
 class CheckPriv:
     priv_id: PrivID
     obj_id: PrivObjectID
 
+    def __eq__(self, other: object) -> bool:
+        # Same result as the generated __eq__, without building field tuples.
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.priv_id == other.priv_id and self.obj_id == other.obj_id
+
 
 @dataclass
 class AuthorityCodeAndRule:
@@ -152,7 +163,7 @@ class ObjPrivResponse:
     authority_code_list: Optional[List[AuthorityCodeAndRule]] = None
 
 
-@dataclass
+@slotted_dataclass
 class PrivObjectIDAndName:
     object_id: str
     object_name: str
@@ -164,52 +175,52 @@ class PrivObjectIDAndName:
 # ============ Catalog types ============
 
 
-@dataclass
+@slotted_dataclass
 class CatalogCreateRequest:
     catalog_name: str
     comment: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class CatalogCreateResponse:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class CatalogDeleteRequest:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class CatalogDeleteResponse:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class CatalogUpdateRequest:
     catalog_id: CatalogID
     catalog_name: str
     comment: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class CatalogUpdateResponse:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class CatalogInfoRequest:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class CatalogInfoResponse:
     catalog_id: CatalogID
     catalog_name: str
     comment: str
 
 
-@dataclass
+@slotted_dataclass
 class CatalogResponse:
     catalog_id: CatalogID
     catalog_name: str
@@ -225,7 +236,7 @@ class CatalogResponse:
     updated_by: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class TreeNode:
     typ: str
     id: str
@@ -236,22 +247,22 @@ class TreeNode:
     node_list: List["TreeNode"] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class CatalogTreeResponse:
     tree: List[TreeNode] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class CatalogListResponse:
     list: List[CatalogResponse] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class CatalogRefListRequest:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class CatalogRefListResponse:
     list: List["VolumeRefResp"] = field(default_factory=list)
 
@@ -259,45 +270,45 @@ class CatalogRefListResponse:
 # ============ Database types ============
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseCreateRequest:
     database_name: str
     comment: str
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseCreateResponse:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseDeleteRequest:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseDeleteResponse:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseUpdateRequest:
     database_id: DatabaseID
     comment: str
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseUpdateResponse:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseInfoRequest:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseInfoResponse:
     database_id: DatabaseID
     database_name: str
@@ -306,7 +317,7 @@ class DatabaseInfoResponse:
     updated_at: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseResponse:
     database_id: DatabaseID
     database_name: str
@@ -321,22 +332,22 @@ class DatabaseResponse:
     updated_by: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseListRequest:
     catalog_id: CatalogID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseListResponse:
     list: List[DatabaseResponse] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseChildrenRequest:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseChildrenResponse:
     id: str
     name: str
@@ -351,17 +362,17 @@ class DatabaseChildrenResponse:
     updated_by: str
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseChildrenResponseData:
     list: List[DatabaseChildrenResponse] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseRefListRequest:
     database_id: DatabaseID
 
 
-@dataclass
+@slotted_dataclass
 class DatabaseRefListResponse:
     list: List["VolumeRefResp"] = field(default_factory=list)
 
@@ -369,46 +380,46 @@ class DatabaseRefListResponse:
 # ============ Volume types ============
 
 
-@dataclass
+@slotted_dataclass
 class VolumeCreateRequest:
     name: str
     database_id: DatabaseID
     comment: str
 
 
-@dataclass
+@slotted_dataclass
 class VolumeCreateResponse:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeDeleteRequest:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeDeleteResponse:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeUpdateRequest:
     volume_id: VolumeID
     name: str
     comment: str
 
 
-@dataclass
+@slotted_dataclass
 class VolumeUpdateResponse:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeInfoRequest:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeInfoResponse:
     volume_id: VolumeID
     volume_name: str
@@ -418,7 +429,7 @@ class VolumeInfoResponse:
     updated_at: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class VolumeRefResp:
     volume_id: VolumeID
     volume_name: str
@@ -426,17 +437,17 @@ class VolumeRefResp:
     ref_id: str
 
 
-@dataclass
+@slotted_dataclass
 class VolumeRefListRequest:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeRefListResponse:
     list: List[VolumeRefResp] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class VolumeChildrenResponse:
     id: str
     name: str
@@ -458,36 +469,36 @@ class VolumeChildrenResponse:
     updated_at: str
 
 
-@dataclass
+@slotted_dataclass
 class VolumeFullPathRequest:
     database_id_list: Optional[List[DatabaseID]] = None
     volume_id_list: Optional[List[VolumeID]] = None
     folder_id_list: Optional[List[FileID]] = None
 
 
-@dataclass
+@slotted_dataclass
 class VolumeFullPathResponse:
     database_full_path: List[FullPath] = field(default_factory=list)
     volume_full_path: List[FullPath] = field(default_factory=list)
     folder_full_path: List[FullPath] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class VolumeAddRefWorkflowRequest:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeAddRefWorkflowResponse:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeRemoveRefWorkflowRequest:
     volume_id: VolumeID
 
 
-@dataclass
+@slotted_dataclass
 class VolumeRemoveRefWorkflowResponse:
     volume_id: VolumeID
 
@@ -495,7 +506,7 @@ class VolumeRemoveRefWorkflowResponse:
 # ============ Data Analysis types ============
 
 
-@dataclass
+@slotted_dataclass
 class DataAskingTableConfig:
     """Table configuration for NL2SQL in data asking context."""
     type: str  # "all", "none", "specified"
@@ -504,7 +515,7 @@ class DataAskingTableConfig:
     table_list: List[str] = field(default_factory=list)  # Table name list, used when type is "specified"
 
 
-@dataclass
+@slotted_dataclass
 class FileConfig:
     """File configuration for RAG."""
     type: str  # "all", "none", "specified"
@@ -512,13 +523,13 @@ class FileConfig:
     file_id_list: List[str] = field(default_factory=list)  # File ID list, used when type is "specified"
 
 
-@dataclass
+@slotted_dataclass
 class FilterConditions:
     """Filter conditions."""
     type: str  # "all", "non_inter_data"
 
 
-@dataclass
+@slotted_dataclass
 class CodeGroup:
     """Code group."""
     code: str = ""  # Parent-level code
@@ -526,7 +537,7 @@ class CodeGroup:
     values: List[str] = field(default_factory=list)  # Code value list
 
 
-@dataclass
+@slotted_dataclass
 class DataScope:
     """Data scope configuration."""
     type: str  # "all", "specified"
@@ -534,7 +545,7 @@ class DataScope:
     code_group: List[CodeGroup] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class DataSource:
     """Data source configuration."""
     type: str  # "all", "specified"
@@ -542,7 +553,7 @@ class DataSource:
     files: Optional[FileConfig] = None
 
 
-@dataclass
+@slotted_dataclass
 class DataAnalysisConfig:
     """Data analysis configuration."""
     mcp_server_url: Optional[str] = None  # MCP server URL
@@ -553,7 +564,7 @@ class DataAnalysisConfig:
     data_scope: Optional[DataScope] = None
 
 
-@dataclass
+@slotted_dataclass
 class DataAnalysisRequest:
     """Request for data analysis."""
     question: str
@@ -563,7 +574,7 @@ class DataAnalysisRequest:
     config: Optional[DataAnalysisConfig] = None
 
 
-@dataclass
+@slotted_dataclass
 class QuestionType:
     """Question classification result."""
     type: str  # "query", "attribution"
@@ -571,14 +582,14 @@ class QuestionType:
     reason: str
 
 
-@dataclass
+@slotted_dataclass
 class InitEventData:
     """Data field in an init event."""
     request_id: str
     session_title: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class DataAnalysisStreamEvent:
     """
     Single event in the SSE stream.
@@ -625,8 +636,8 @@ class DataAnalysisStreamEvent:
         # Try to parse from RawData
         if self.raw_data:
             try:
-                import json
-                parsed = json.loads(self.raw_data.decode('utf-8'))
+                from . import _json
+                parsed = _json.loads(self.raw_data)
                 if isinstance(parsed, dict) and "data" in parsed:
                     data = parsed["data"]
                     if isinstance(data, dict):
@@ -637,19 +648,19 @@ class DataAnalysisStreamEvent:
                                 request_id=request_id,
                                 session_title=session_title
                             )
-            except (json.JSONDecodeError, UnicodeDecodeError, KeyError):
+            except (_json.JSONDecodeError, UnicodeDecodeError, KeyError):
                 pass
         
         return None
 
 
-@dataclass
+@slotted_dataclass
 class CancelAnalyzeRequest:
     """Request to cancel a data analysis request."""
     request_id: str  # Required: The request ID of the analysis to cancel
 
 
-@dataclass
+@slotted_dataclass
 class CancelAnalyzeResponse:
     """Response from canceling a data analysis request."""
     request_id: str  # The request ID that was cancelled
@@ -673,7 +684,7 @@ class DedupStrategy:
     REPLACE = "replace"  # Replace duplicate files
 
 
-@dataclass
+@slotted_dataclass
 class DedupConfig:
     """Deduplication configuration."""
     by: List[str]
@@ -756,20 +767,20 @@ def new_dedup_config_skip_by_md5() -> DedupConfig:
 TaskID = int
 
 
-@dataclass
+@slotted_dataclass
 class TaskInfoRequest:
     """Request to get task information."""
     task_id: TaskID
 
 
-@dataclass
+@slotted_dataclass
 class LoadResult:
     """Represents a single file load result."""
     lines: int
     reason: Optional[str] = None
 
 
-@dataclass
+@slotted_dataclass
 class TaskInfoResponse:
     """Task information response."""
     id: str
@@ -795,7 +806,7 @@ class TaskInfoResponse:
 # ============ Handler: User types ============
 
 
-@dataclass
+@slotted_dataclass
 class UserCreateRequest:
     """Request to create a user."""
     name: str
@@ -807,7 +818,7 @@ class UserCreateRequest:
     get_api_key: bool = False  # Whether to return API key in response
 
 
-@dataclass
+@slotted_dataclass
 class UserCreateResponse:
     """Response from creating a user."""
     id: UserID
@@ -856,7 +867,7 @@ class FileType:
 
 # ============ Handler: Workflow types ============
 
-@dataclass
+@slotted_dataclass
 class ProcessMode:
     """Processing mode for workflows."""
     interval: int  # Processing interval in seconds
@@ -885,7 +896,7 @@ class WorkflowJobStatus:
             return f"unknown({status})"
 
 
-@dataclass
+@slotted_dataclass
 class WorkflowMetadata:
     """Workflow metadata for creating a workflow."""
     name: str = ""
@@ -899,14 +910,14 @@ class WorkflowMetadata:
     workflow: Optional["CatalogWorkflow"] = None
 
 
-@dataclass
+@slotted_dataclass
 class CatalogWorkflow:
     """Workflow definition with nodes and connections."""
     nodes: List["CatalogWorkflowNode"] = field(default_factory=list)
     connections: List["CatalogWorkflowConnection"] = field(default_factory=list)
 
 
-@dataclass
+@slotted_dataclass
 class CatalogWorkflowNode:
     """Workflow node definition."""
     id: str
@@ -914,7 +925,7 @@ class CatalogWorkflowNode:
     init_parameters: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # Required: must be present, use empty dict {} if no parameters
 
 
-@dataclass
+@slotted_dataclass
 class CatalogWorkflowConnection:
     """Workflow connection definition."""
     sender: str
@@ -923,7 +934,7 @@ class CatalogWorkflowConnection:
     receiver_port: str = ""  # Optional port for receiver component
 
 
-@dataclass
+@slotted_dataclass
 class WorkflowCreateResponse:
     """Response from creating a workflow."""
     created_at: str = ""
@@ -947,7 +958,7 @@ class WorkflowCreateResponse:
     files: str = ""
 
 
-@dataclass
+@slotted_dataclass
 class WorkflowJobListRequest:
     """Request to list workflow jobs."""
     workflow_id: str = ""  # Filter by workflow ID
@@ -957,7 +968,7 @@ class WorkflowJobListRequest:
     page_size: int = 0  # Page size (default 20)
 
 
-@dataclass
+@slotted_dataclass
 class WorkflowJob:
     """Workflow job in the list."""
     job_id: str  # Job ID (API returns "id")
@@ -968,7 +979,7 @@ class WorkflowJob:
     end_time: str = ""  # Job end time (empty if not finished)
 
 
-@dataclass
+@slotted_dataclass
 class WorkflowJobListResponse:
     """Response from listing workflow jobs."""
     jobs: List[WorkflowJob] = field(default_factory=list)  # List of workflow jobs (API returns "jobs" not "list")
@@ -1,20 +1,24 @@
 """Client and call options for the MOI SDK."""
 
 from typing import Optional, Dict, Any
-from dataclasses import dataclass, field
+from dataclasses import field
 import requests
+from requests.adapters import HTTPAdapter
 
+from ._compat import slotted_dataclass
 
-@dataclass
+
+@slotted_dataclass
 class ClientOptions:
     """Configuration options for the SDK client."""
     http_client: Optional[requests.Session] = None
+    http_adapter: Optional[HTTPAdapter] = None
     user_agent: str = "matrixflow-sdk-python/0.1.0"
     default_headers: Dict[str, str] = field(default_factory=dict)
     timeout: float = 30.0
 
 
-@dataclass
+@slotted_dataclass
 class CallOptions:
     """Configuration options for individual API calls."""
     headers: Dict[str, str] = field(default_factory=dict)
@@ -44,6 +48,21 @@ def with_http_client(client: requests.Session) -> ClientOption:
     return _Option()
 
 
+def with_http_adapter(adapter: HTTPAdapter) -> ClientOption:
+    """
+    Mount a custom transport adapter on the session the SDK creates.
+    
+    Use this to plug in a tuned or alternative transport (retries, pool sizes,
+    socket options, a platform-specific backend) without building the whole
+    session yourself. It is ignored when with_http_client supplies a session.
+    """
+    class _Option(ClientOption):
+        def __call__(self, options: ClientOptions) -> None:
+            if adapter is not None:
+                options.http_adapter = adapter
+    return _Option()
+
+
 def with_timeout(timeout: float) -> ClientOption:
     """Configure the timeout on the underlying HTTP client."""
     class _Option(ClientOption):
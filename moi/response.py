@@ -1,11 +1,15 @@
 """Response envelope handling for the MOI SDK."""
 
 from typing import Any, Optional
-import json
+
+from . import _json
 
 
 class APIEnvelope:
     """Represents the API response envelope."""
+
+    # One envelope is built per response; slots keep it small and cheap to fill.
+    __slots__ = ("code", "msg", "data", "request_id")
     
     def __init__(self, code: str = "", msg: str = "", data: Any = None, request_id: str = ""):
         self.code = code
@@ -16,15 +20,11 @@ class APIEnvelope:
     @classmethod
     def from_dict(cls, d: dict) -> 'APIEnvelope':
         """Create an APIEnvelope from a dictionary."""
-        return cls(
-            code=d.get("code", ""),
-            msg=d.get("msg", ""),
-            data=d.get("data"),
-            request_id=d.get("request_id", "")
-        )
+        get = d.get
+        return cls(get("code", ""), get("msg", ""), get("data"), get("request_id", ""))
     
     @classmethod
     def from_json(cls, json_str: str) -> 'APIEnvelope':
         """Create an APIEnvelope from a JSON string."""
-        return cls.from_dict(json.loads(json_str))
+        return cls.from_dict(_json.loads(json_str))
 
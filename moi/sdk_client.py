@@ -2,15 +2,39 @@
 
 from __future__ import annotations
 
-import copy
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict, is_dataclass
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, IO, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, IO, Union
+import threading
+import warnings
 
+from . import _json
 from .client import RawClient
 from .errors import ErrNilRequest
-from .options import CallOption
+from .options import CallOption, ClientOption
 from .models import DedupConfig
 
+# Clients handed out by get_client, keyed by (base_url, api_key) with the
+# most recently used last. Past _CLIENT_CACHE_MAX entries the oldest client
+# is dropped and closed.
+_CLIENT_CACHE: "OrderedDict[Tuple[str, str], SDKClient]" = OrderedDict()
+_CLIENT_CACHE_LOCK = threading.Lock()
+_CLIENT_CACHE_MAX = 8
+
+# Role lookups by name scan at most this many pages of _ROLE_PAGE_SIZE roles.
+_ROLE_PAGE_SIZE = 100
+_ROLE_MAX_PAGES = 10
+
+# Pre-encoded {"operation": "run_sql", "statement": ...} body; see run_sql.
+_RUN_SQL_PREFIX = b'{"operation":"run_sql","statement":'
+
+
+def _require_non_blank(name: str, value: Optional[str]) -> None:
+    """Raise ValueError("<name> is required") if value is empty or only whitespace."""
+    if not value or not value.strip():
+        raise ValueError(f"{name} is required")
+
 
 @dataclass
 class TablePrivInfo:
@@ -77,6 +101,16 @@ class SDKClient:
         cloned_raw = self.raw.with_special_user(api_key)
         return SDKClient(cloned_raw)
 
+    def close(self) -> None:
+        """Close the underlying RawClient."""
+        self.raw.close()
+
+    def __enter__(self) -> "SDKClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
     # ------------------------------------------------------------------
     # Role helpers
     # ------------------------------------------------------------------
@@ -103,7 +137,11 @@ class SDKClient:
             "obj_authority_code_list": obj_priv_list,
         }
         response = self.raw.create_role(payload)
-        return response.get("id") if isinstance(response, dict) else None, True
+        try:
+            role_id = response["id"]
+        except (KeyError, TypeError):
+            role_id = None
+        return role_id, True
 
     def update_table_role(
         self,
@@ -111,8 +149,15 @@ class SDKClient:
         comment: str,
         table_privs: Iterable[TablePrivInfo | Dict[str, Any]],
         global_privs: Optional[Sequence[str]],
+        current_role: Optional[Dict[str, Any]] = None,
     ) -> Any:
-        """Update role privileges while optionally preserving comment/global privileges."""
+        """
+        Update role privileges while optionally preserving comment/global privileges.
+
+        When comment is empty or global_privs is None the current values are
+        read from the role. Pass ``current_role`` (a ``get_role`` response the
+        caller already holds) to reuse it instead of fetching the role again.
+        """
         if not role_id:
             raise ValueError("role_id is required")
 
@@ -120,7 +165,7 @@ class SDKClient:
         priv_list = list(global_privs) if global_privs is not None else None
 
         if not comment or global_privs is None:
-            role_resp = self.raw.get_role({"id": role_id})
+            role_resp = current_role if current_role is not None else self.raw.get_role({"id": role_id})
             if not role_resp:
                 raise ErrNilRequest(f"role {role_id} not found")
             if not comment:
@@ -159,7 +204,9 @@ class SDKClient:
         if not table_config:
             raise ValueError("table_config is required")
 
-        config = copy.deepcopy(table_config)
+        # Only top-level keys are replaced below, so a shallow copy keeps the
+        # caller's dict untouched without cloning nested structures.
+        config = dict(table_config)
         conn_file_ids = config.get("conn_file_ids") or []
         if not conn_file_ids:
             raise ValueError("table_config.conn_file_ids must contain at least one file ID")
@@ -188,12 +235,9 @@ class SDKClient:
 
     def run_sql(self, statement: str, *opts: CallOption) -> Any:
         """Run a SQL statement via the NL2SQL RunSQL operation."""
-        if not statement or not statement.strip():
-            raise ValueError("statement is required")
-        payload = {
-            "operation": "run_sql",
-            "statement": statement,
-        }
+        _require_non_blank("statement", statement)
+        # Only the statement varies, so it is encoded into a fixed template.
+        payload = _RUN_SQL_PREFIX + _json.dumps(statement) + b"}"
         return self.raw.run_nl2sql(payload, *opts)
 
     def import_local_file_to_volume(
@@ -232,8 +276,7 @@ class SDKClient:
             )
             print(f"Uploaded file: {resp.get('file_id')}")
         """
-        if not file_path or not file_path.strip():
-            raise ValueError("file_path is required")
+        _require_non_blank("file_path", file_path)
         if not volume_id:
             raise ValueError("volume_id is required")
         if not meta or not meta.get("filename"):
@@ -395,12 +438,22 @@ class SDKClient:
     # Helpers
     # ------------------------------------------------------------------
 
-    def _find_role_by_name(self, role_name: str) -> Optional[Dict[str, Any]]:
-        page = 1
-        page_size = 100
-        max_pages = 1000
+    def _iter_role_pages(
+        self, role_name: str, page_size: int = _ROLE_PAGE_SIZE, max_pages: int = _ROLE_MAX_PAGES
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yield pages of roles matching role_name, newest first.
 
-        while page <= max_pages:
+        The scan stops after max_pages pages; if the listing had more, a
+        RuntimeWarning says the rest were not checked.
+
+        While the caller scans one page, the next one is already being fetched
+        on a background thread, so multi-page scans overlap request latency
+        with processing. Single-page results never start a thread, and at most
+        one page is fetched in the background at a time.
+        """
+
+        def fetch(page: int) -> Tuple[List[Dict[str, Any]], int]:
             request = {
                 "keyword": "",
                 "common_condition": {
@@ -418,34 +471,55 @@ class SDKClient:
                 },
             }
             response = self.raw.list_roles(request)
-            role_list = []
-            total = 0
-            if isinstance(response, dict):
-                role_list = response.get("role_list") or response.get("list") or []
-                total = response.get("total") or 0
-
-            for role in role_list:
-                if role.get("name") == role_name:
-                    return role
-
-            if len(role_list) < page_size:
-                break
-            if total and page * page_size >= total:
-                break
-            page += 1
+            try:
+                return response.get("role_list") or response.get("list") or [], response.get("total") or 0
+            except AttributeError:  # not a dict
+                return [], 0
+
+        executor: Optional[ThreadPoolExecutor] = None
+        try:
+            page = 1
+            role_list, total = fetch(page)
+            while True:
+                pending = None
+                has_more = len(role_list) >= page_size and not (total and page * page_size >= total)
+                truncated = has_more and page >= max_pages
+                if has_more and not truncated:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(max_workers=1)
+                    pending = executor.submit(fetch, page + 1)
+                yield role_list
+                if pending is None:
+                    if truncated:
+                        warnings.warn(
+                            f"stopped looking for role {role_name!r} after {max_pages} pages "
+                            f"of {page_size}; later pages were not checked",
+                            RuntimeWarning,
+                            stacklevel=4,
+                        )
+                    return
+                page += 1
+                role_list, total = pending.result()
+        finally:
+            if executor is not None:
+                # On an early exit, drop a prefetch that has not started and
+                # wait for one in flight, so no request is still using the
+                # client's session after the scan returns.
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def _find_role_by_name(self, role_name: str) -> Optional[Dict[str, Any]]:
+        for role_list in self._iter_role_pages(role_name):
+            match = next((role for role in role_list if role.get("name") == role_name), None)
+            if match is not None:
+                return match
 
         return None
 
     def _build_obj_priv_list(
         self, table_privs: Iterable[TablePrivInfo | Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
-        obj_priv_list: List[Dict[str, Any]] = []
-        for entry in table_privs:
-            payload = self._normalize_table_priv(entry)
-            if not payload:
-                continue
-            obj_priv_list.append(payload)
-        return obj_priv_list
+        normalize = self._normalize_table_priv
+        return [payload for payload in map(normalize, table_privs) if payload]
 
     @staticmethod
     def _normalize_table_priv(
@@ -454,20 +528,26 @@ class SDKClient:
         if entry is None:
             return None
 
-        if is_dataclass(entry):
-            data = asdict(entry)
-        elif isinstance(entry, dict):
-            data = entry
+        if isinstance(entry, TablePrivInfo):
+            # Read the three fields directly; asdict() would deep-copy every
+            # code list only for the values to be read once.
+            table_id = entry.table_id
+            authority_code_list = entry.authority_code_list
+            priv_codes = entry.priv_codes or []
         else:
-            raise TypeError("table_privs entries must be TablePrivInfo or dicts")
+            if isinstance(entry, dict):
+                data = entry
+            elif is_dataclass(entry):
+                data = asdict(entry)
+            else:
+                raise TypeError("table_privs entries must be TablePrivInfo or dicts")
+            table_id = data.get("table_id")
+            authority_code_list = data.get("authority_code_list")
+            priv_codes = data.get("priv_codes") or []
 
-        table_id = data.get("table_id")
         if not table_id:
             return None
 
-        authority_code_list = data.get("authority_code_list")
-        priv_codes = data.get("priv_codes") or []
-
         if authority_code_list:
             acl = authority_code_list
         elif priv_codes:
@@ -512,10 +592,8 @@ class SDKClient:
             for file in resp.get("list", []):
                 print(f"Found file: {file['name']} (ID: {file['id']})")
         """
-        if not file_name or not file_name.strip():
-            raise ValueError("file_name is required")
-        if not volume_id or not volume_id.strip():
-            raise ValueError("volume_id is required")
+        _require_non_blank("file_name", file_name)
+        _require_non_blank("volume_id", volume_id)
         
         # Build the request with filters matching the provided JSON example
         req = {
@@ -597,12 +675,9 @@ class SDKClient:
         """
         from .models import FileType
         
-        if not target_volume_id or not target_volume_id.strip():
-            raise ValueError("target_volume_id is required")
-        if not source_volume_id or not source_volume_id.strip():
-            raise ValueError("source_volume_id is required")
-        if not workflow_name or not workflow_name.strip():
-            raise ValueError("workflow_name is required")
+        _require_non_blank("target_volume_id", target_volume_id)
+        _require_non_blank("source_volume_id", source_volume_id)
+        _require_non_blank("workflow_name", workflow_name)
         
         # Build the workflow metadata with a complete document processing pipeline
         req = {
@@ -709,10 +784,8 @@ class SDKClient:
             job = sdk.get_workflow_job("workflow-123", "file-456")
             print(f"Job ID: {job['job_id']}, Status: {job['status']}")
         """
-        if not workflow_id or not workflow_id.strip():
-            raise ValueError("workflow_id is required")
-        if not source_file_id or not source_file_id.strip():
-            raise ValueError("source_file_id is required")
+        _require_non_blank("workflow_id", workflow_id)
+        _require_non_blank("source_file_id", source_file_id)
         
         # Query jobs with both filters
         resp = self.raw.list_workflow_jobs({
@@ -761,10 +834,8 @@ class SDKClient:
         """
         import time
         
-        if not workflow_id or not workflow_id.strip():
-            raise ValueError("workflow_id is required")
-        if not source_file_id or not source_file_id.strip():
-            raise ValueError("source_file_id is required")
+        _require_non_blank("workflow_id", workflow_id)
+        _require_non_blank("source_file_id", source_file_id)
         
         if poll_interval <= 0:
             poll_interval = 2.0
@@ -800,3 +871,39 @@ class SDKClient:
             except ValueError:
                 pass  # Job not found yet, continue polling
 
+
+def get_client(base_url: str, api_key: str, *opts: ClientOption) -> SDKClient:
+    """
+    Return a shared SDKClient for the given base URL and API key.
+
+    Clients are memoized per (base_url, api_key), so repeated calls reuse the
+    same instance and its pooled HTTP connections instead of paying a new
+    TCP/TLS handshake for every client. The returned client is shared
+    process-wide: don't close it or use it in a ``with`` block, since that
+    would close it for every other caller. Up to eight clients are kept; the
+    least recently used one is closed when a ninth is created.
+
+    Calls that pass ClientOptions are not memoized and return a new client
+    that the caller owns and should close. Use ``SDKClient(RawClient(...))``
+    directly when an isolated instance is needed.
+
+    Example:
+        client = get_client("https://api.example.com", "your-api-key")
+        assert client is get_client("https://api.example.com", "your-api-key")
+    """
+    if opts:
+        return SDKClient(RawClient(base_url, api_key, *opts))
+    key = (base_url, api_key)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is not None:
+            _CLIENT_CACHE.move_to_end(key)
+            return client
+        client = SDKClient(RawClient(base_url, api_key))
+        _CLIENT_CACHE[key] = client
+        evicted = None
+        if len(_CLIENT_CACHE) > _CLIENT_CACHE_MAX:
+            _, evicted = _CLIENT_CACHE.popitem(last=False)
+    if evicted is not None:
+        evicted.close()
+    return client
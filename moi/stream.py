@@ -2,30 +2,244 @@
 
 from __future__ import annotations
 
-from typing import Iterator, Optional
-import json
+from functools import partial
+from typing import BinaryIO, Iterator, List, Optional
+import io
 import os
+import threading
 import requests
+from requests import exceptions as requests_errors
+from urllib3 import HTTPResponse
+from urllib3 import exceptions as urllib3_errors
 
+from . import _json
 from .models import DataAnalysisStreamEvent
 
+# Default read size for file downloads. Large chunks keep per-chunk Python
+# overhead low on big bodies; pass a smaller chunk_size to bound memory.
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Reusable download buffers, so repeated downloads do not allocate a fresh
+# chunk-sized buffer each time. At most _BUFFER_POOL_MAX buffers are kept.
+_BUFFER_POOL: List[bytearray] = []
+_BUFFER_POOL_LOCK = threading.Lock()
+_BUFFER_POOL_MAX = 8
+
+
+# Bodies whose Content-Length is below this many bytes are read in full when
+# a FileStream is created, so the connection goes back to the pool at once
+# instead of staying checked out until close(). MOI_STREAM_EAGER_BYTES, read
+# each time a FileStream is created, overrides it (0 disables eager reads).
+EAGER_READ_BYTES = 256 * 1024
+
+
+def _eager_read_bytes() -> int:
+    try:
+        return int(os.environ.get("MOI_STREAM_EAGER_BYTES", EAGER_READ_BYTES))
+    except ValueError:
+        return EAGER_READ_BYTES
+
+
+def acquire_buffer(size: int = DEFAULT_CHUNK_SIZE) -> bytearray:
+    """Take a bytearray of exactly size bytes from the pool, or allocate one."""
+    with _BUFFER_POOL_LOCK:
+        for index, buf in enumerate(_BUFFER_POOL):
+            if len(buf) == size:
+                return _BUFFER_POOL.pop(index)
+    return bytearray(size)
+
+
+def release_buffer(buf: bytearray) -> None:
+    """Return a buffer from acquire_buffer to the pool once no views of it are in use."""
+    with _BUFFER_POOL_LOCK:
+        if len(_BUFFER_POOL) < _BUFFER_POOL_MAX:
+            _BUFFER_POOL.append(buf)
+
 
 class FileStream:
-    """Wraps a streaming HTTP response body."""
+    """
+    Wraps a streaming HTTP response body.
+    
+    Small bodies (see EAGER_READ_BYTES) are read into memory up front and the
+    response is closed right away; the stream API behaves the same either way,
+    and ``body`` is always ``response.raw``.
+    """
 
     def __init__(self, response: requests.Response):
         self._response = response
         self.body = response.raw
         self.headers = response.headers
         self.status_code = response.status_code
+        # Decoded body of a small response read at construction.
+        self._buffer: Optional[io.BytesIO] = None
+        # Set once iter_content has read a urllib3 body to the end.
+        self._consumed = False
+        self._pending = memoryview(b"")
+        # Chunk iterator behind sized reads of a urllib3 body, created on the
+        # first one and kept for the rest of the body (see _read_chunk).
+        self._chunks: Optional[Iterator[bytes]] = None
+        length = self.content_length
+        if length is not None and length < _eager_read_bytes():
+            self._buffer = io.BytesIO(response.content)
+            response.close()
+
+    def iter_content(self, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Iterate over the response body in chunks of up to chunk_size bytes."""
+        # Buffered bodies and the requests fallback are returned as they are.
+        # urllib3 bodies go through _iter_raw, a single generator layer that
+        # translates urllib3 errors into requests exceptions.
+        if self._buffer is not None:
+            return iter(partial(self._buffer.read, chunk_size), b"")
+        if self._chunks is not None or self._pending:
+            # Continue where read/read_into stopped.
+            return self._iter_chunks(chunk_size)
+        raw = self.body
+        if isinstance(raw, HTTPResponse):
+            if self._consumed:
+                # What requests raises for a second pass over a streamed body.
+                raise requests_errors.StreamConsumedError()
+            # Read straight from urllib3, skipping requests' wrapper generator.
+            return self._iter_raw(raw, chunk_size)
+        return self._response.iter_content(chunk_size=chunk_size, decode_unicode=False)
+
+    def _iter_raw(self, raw: HTTPResponse, chunk_size: int) -> Iterator[bytes]:
+        # Same error translation as requests.Response.iter_content.
+        try:
+            yield from raw.stream(chunk_size, decode_content=True)
+        except urllib3_errors.ProtocolError as e:
+            raise requests_errors.ChunkedEncodingError(e)
+        except urllib3_errors.DecodeError as e:
+            raise requests_errors.ContentDecodingError(e)
+        except urllib3_errors.ReadTimeoutError as e:
+            raise requests_errors.ConnectionError(e)
+        except urllib3_errors.SSLError as e:
+            raise requests_errors.SSLError(e)
+        self._consumed = True
+
+    def _iter_chunks(self, chunk_size: int) -> Iterator[bytes]:
+        while True:
+            data = self._read_chunk(chunk_size)
+            if not data:
+                return
+            yield data.tobytes()
+
+    def _decoding_raw(self):
+        raw = self.body
+        if isinstance(raw, HTTPResponse):
+            # requests opens responses with decoding off; match iter_content.
+            raw.decode_content = True
+        return raw
 
-    def iter_content(self, chunk_size: int = 8192) -> Iterator[bytes]:
-        """Iterate over the response body."""
-        yield from self._response.iter_content(chunk_size)
+    def iter_into(self, buf: bytearray) -> Iterator[memoryview]:
+        """
+        Read the body into buf, yielding a memoryview of the bytes filled each time.
+        
+        Chunks come from iter_content (with the same decoding and error
+        translation) and are copied into buf, so callers can work with one
+        fixed-size buffer. Each view is only valid until the next one is
+        requested, so consume it (e.g. ``f.write(view)``) before advancing.
+        Pair with ``acquire_buffer``/``release_buffer`` to reuse buffers
+        across downloads.
+        """
+        size = len(buf)
+        view = memoryview(buf)
+        for chunk in self.iter_content(size):
+            # urllib3 1.x can decode more than size bytes from a compressed chunk.
+            chunk_view = memoryview(chunk)
+            for start in range(0, len(chunk), size):
+                part = chunk_view[start:start + size]
+                count = len(part)
+                view[:count] = part
+                yield view[:count]
+
+    def copy_to(self, fp: BinaryIO, chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+        """
+        Copy the rest of the body into the binary file object fp.
+        
+        This is the preferred way to save a download: decoded chunks are
+        written to fp as they arrive, so memory use stays at one chunk.
+        
+        Args:
+            fp: Writable binary file object
+            chunk_size: Read size in bytes (default 1 MiB)
+        
+        Returns:
+            Number of bytes written
+        """
+        written = 0
+        write = fp.write
+        for chunk in self.iter_content(chunk_size):
+            write(chunk)
+            written += len(chunk)
+        return written
 
     def read(self, size: int = -1) -> bytes:
-        """Read raw bytes from the response."""
-        return self._response.raw.read(size)
+        """
+        Read up to size bytes of the decoded body, or the rest of it if size is negative.
+        
+        Reading to the end returns the remaining body as one bytes object;
+        for large downloads prefer copy_to or iter_content.
+        """
+        if size is None or size < 0:
+            if self._buffer is not None:
+                rest = self._buffer.read()
+            elif self._chunks is not None:
+                # Mid-body reads of a chunked response can't be mixed with
+                # raw.read(), so drain the same iterator.
+                rest = b"".join(self._chunks)
+            else:
+                rest = self._decoding_raw().read()
+            if self._pending:
+                rest = self._pending.tobytes() + rest
+                self._pending = memoryview(b"")
+            return rest
+        if size == 0:
+            return b""
+        data = self._read_chunk(size)
+        # Hand back the chunk itself when it was not split.
+        return data.obj if len(data) == len(data.obj) else data.tobytes()
+
+    def _read_chunk(self, size: int) -> memoryview:
+        # Up to size decoded bytes, leftovers from the previous chunk first;
+        # empty at the end of the body.
+        if not self._pending:
+            raw = self.body if self._buffer is None else self._buffer
+            if isinstance(raw, HTTPResponse):
+                # urllib3 1.x can decode more than size bytes from a compressed
+                # read (the rest is kept for the next call); stream() also
+                # skips reads that decode to nothing before the end. One
+                # iterator serves the whole body: closing a half-read
+                # read_chunked() generator drops the connection, and the
+                # chunk reads that follow are sized by the first call.
+                if self._chunks is None:
+                    self._chunks = self._iter_raw(raw, size)
+                chunk = next(self._chunks, b"")
+            else:
+                chunk = raw.read(size)
+            self._pending = memoryview(chunk)
+        data = self._pending[:size]
+        self._pending = self._pending[size:]
+        return data
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """Body size from the Content-Length header, or None if it is absent or invalid."""
+        try:
+            length = int(self.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            return None
+        return length if length >= 0 else None
+
+    def read_into(self, buf: bytearray) -> int:
+        """
+        Copy up to len(buf) decoded body bytes into buf.
+        
+        Returns how many bytes were filled, or 0 at the end of the body.
+        """
+        data = self._read_chunk(len(buf))
+        count = len(data)
+        buf[:count] = data
+        return count
 
     def close(self) -> None:
         """Close the underlying HTTP response."""
@@ -61,14 +275,8 @@ class FileStream:
             os.makedirs(dir_path, mode=0o755, exist_ok=True)
         
         # Write the stream content to the file
-        written = 0
         with open(file_path, 'wb') as f:
-            for chunk in self._response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    written += len(chunk)
-        
-        return written
+            return self.copy_to(f)
 
     def __enter__(self) -> "FileStream":
         return self
@@ -179,7 +387,7 @@ class DataAnalysisStream:
                         data_str = "\n".join(data_lines)
                         event.raw_data = data_str.encode('utf-8')
                         try:
-                            parsed = json.loads(data_str)
+                            parsed = _json.loads(data_str)
                             if isinstance(parsed, dict):
                                 # Extract all fields from parsed JSON
                                 event.data = parsed
@@ -187,7 +395,7 @@ class DataAnalysisStream:
                                 event.source = parsed.get("source") or event.source
                                 event.step_type = parsed.get("step_type") or event.step_type
                                 event.step_name = parsed.get("step_name") or event.step_name
-                        except json.JSONDecodeError:
+                        except _json.JSONDecodeError:
                             # If JSON parsing fails, return raw data (event already has raw_data set)
                             # But still set event.type if event_type was specified
                             if event_type:
@@ -211,7 +419,7 @@ class DataAnalysisStream:
                 data_str = "\n".join(data_lines)
                 event.raw_data = data_str.encode('utf-8')
                 try:
-                    parsed = json.loads(data_str)
+                    parsed = _json.loads(data_str)
                     if isinstance(parsed, dict):
                         # Extract all fields from parsed JSON
                         event.data = parsed
@@ -219,7 +427,7 @@ class DataAnalysisStream:
                         event.source = parsed.get("source") or event.source
                         event.step_type = parsed.get("step_type") or event.step_type
                         event.step_name = parsed.get("step_name") or event.step_name
-                except json.JSONDecodeError:
+                except _json.JSONDecodeError:
                     # If JSON parsing fails, return raw data (event already has raw_data set)
                     # But still set event.type if event_type was specified
                     if event_type:
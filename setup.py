@@ -42,6 +42,7 @@ setup(
     packages=find_packages(include=("moi", "moi.*")),
     python_requires=PROJECT.get("requires-python"),
     install_requires=PROJECT.get("dependencies", []),
+    extras_require=PROJECT.get("optional-dependencies", {}),
     classifiers=PROJECT.get("classifiers", []),
     include_package_data=True,
 )
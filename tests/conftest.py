@@ -0,0 +1,23 @@
+"""Shared pytest fixtures for MOI Python SDK tests."""
+
+import pytest
+
+from tests.test_helpers import get_test_client, random_name, swallow
+
+
+@pytest.fixture(scope="module")
+def llm_session():
+    """Create one LLM session per test module and yield (session_id, user_id).
+    
+    Only for tests that work on their own messages and do not depend on
+    what else is in the session (latest message, listings).
+    """
+    client = get_test_client()
+    user_id = random_name("user-")
+    session = client.create_llm_session({
+        "title": random_name("sdk-session-"),
+        "source": "sdk-test",
+        "user_id": user_id,
+    })
+    yield session["id"], user_id
+    swallow(client.delete_llm_session, session["id"])
@@ -1,5 +1,7 @@
 """Tests for client cloning functionality."""
 
+import sys
+
 import pytest
 from moi import RawClient, SDKClient, ErrAPIKeyRequired
 
@@ -77,3 +79,309 @@ class TestSDKClientWithSpecialUser:
             original.with_special_user("")
         assert "API key is required" in str(exc_info.value)
 
+
+
+class TestGetClient:
+    """Test the memoized get_client factory."""
+
+    def test_get_client_returns_shared_instance(self):
+        """Test that the same arguments return the same SDKClient."""
+        from moi import get_client
+
+        first = get_client("https://api.example.com", "shared-key-123")
+        second = get_client("https://api.example.com", "shared-key-123")
+
+        assert isinstance(first, SDKClient)
+        assert first is second
+        assert first.raw._http_client is second.raw._http_client
+
+    def test_get_client_keys_by_api_key(self):
+        """Test that different API keys get different clients."""
+        from moi import get_client
+
+        first = get_client("https://api.example.com", "key-a")
+        second = get_client("https://api.example.com", "key-b")
+
+        assert first is not second
+        assert second.raw._api_key == "key-b"
+
+    def test_get_client_with_options_is_not_cached(self):
+        """Test that calls passing ClientOptions get their own client."""
+        from moi import get_client
+        from moi.options import with_timeout
+
+        first = get_client("https://api.example.com", "opts-key", with_timeout(5))
+        second = get_client("https://api.example.com", "opts-key", with_timeout(5))
+
+        assert first is not second
+        assert first is not get_client("https://api.example.com", "opts-key")
+        first.close()
+        second.close()
+
+    def test_get_client_closes_evicted_clients(self, monkeypatch):
+        """Test that the least recently used client is closed once the cache is full."""
+        from collections import OrderedDict
+
+        from moi import get_client
+
+        monkeypatch.setattr("moi.sdk_client._CLIENT_CACHE", OrderedDict())
+        monkeypatch.setattr("moi.sdk_client._CLIENT_CACHE_MAX", 2)
+        closed = []
+        monkeypatch.setattr(SDKClient, "close", lambda self: closed.append(self))
+
+        first = get_client("https://api.example.com", "key-1")
+        second = get_client("https://api.example.com", "key-2")
+        assert get_client("https://api.example.com", "key-1") is first
+        third = get_client("https://api.example.com", "key-3")
+
+        assert closed == [second]
+        assert get_client("https://api.example.com", "key-1") is first
+        assert get_client("https://api.example.com", "key-3") is third
+
+
+class TestConnectionPool:
+    """Test the HTTP session RawClient creates by default."""
+
+    def test_default_session_uses_larger_pool(self):
+        """Test that the owned session mounts a tuned HTTPAdapter."""
+        client = RawClient("https://api.example.com", "key-123")
+
+        adapter = client._http_client.get_adapter("https://api.example.com/catalog/list")
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_connections == 32
+
+    def test_default_session_retries_gateway_errors(self):
+        """Test that the owned adapter retries 502/503/504 on idempotent methods."""
+        client = RawClient("https://api.example.com", "key-123")
+
+        retries = client._http_client.get_adapter("https://api.example.com").max_retries
+        assert retries.total == 3
+        assert retries.backoff_factor == 0.2
+        assert set(retries.status_forcelist) == {502, 503, 504}
+        assert retries.is_retry("GET", 503)
+        assert not retries.is_retry("POST", 503)
+        assert not retries.raise_on_status
+        assert not retries.respect_retry_after_header
+        assert (retries.connect, retries.read, retries.other) == (0, 0, 0)
+        assert "POST" not in retries.allowed_methods
+
+    def test_default_session_does_not_retry_connection_errors(self):
+        """Test that a dropped connection fails on the first attempt."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        import requests
+
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.close_connection = True
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            client = RawClient(base_url, "key-123")
+
+            with pytest.raises(requests.exceptions.ConnectionError):
+                client._http_client.get(base_url + "/ping", timeout=5)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert len(hits) == 1
+
+    def test_default_session_ignores_retry_after(self):
+        """Test that a long Retry-After does not stall the retries."""
+        import threading
+        import time
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        hits = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                hits.append(self.path)
+                self.send_response(503)
+                self.send_header("Retry-After", "600")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            client = RawClient(base_url, "key-123")
+
+            started = time.monotonic()
+            resp = client._http_client.get(base_url + "/ping", timeout=5)
+            elapsed = time.monotonic() - started
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert resp.status_code == 503
+        assert len(hits) == 4
+        assert elapsed < 5
+
+    def test_default_session_uploads_through_adapter(self):
+        """Test that an upload goes through the owned adapter on a real connection."""
+        import io
+        import threading
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        import urllib3
+
+        received = []
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append(len(self.rfile.read(int(self.headers["Content-Length"]))))
+                body = b'{"code":"OK","msg":"","data":{"file_id":"f-1"}}'
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        class SizedReads(io.BytesIO):
+            def __init__(self, data):
+                super().__init__(data)
+                self.sizes = []
+
+            def read(self, size=-1):
+                self.sizes.append(size)
+                return super().read(size)
+
+        server = HTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = RawClient(f"http://127.0.0.1:{server.server_port}", "key-123")
+            payload = SizedReads(b"x" * (3 * 1024 * 1024))
+            resp = client.upload_local_file(payload, "data.csv", [{"filename": "data.csv", "path": "data.csv"}])
+            client.close()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        assert resp == {"file_id": "f-1"}
+        assert received and received[0] > 3 * 1024 * 1024
+        if int(urllib3.__version__.split(".")[0]) >= 2:
+            # Bodies are read in 1 MiB blocks rather than 16 KiB ones.
+            assert max(payload.sizes) > 512 * 1024
+
+    def test_session_advertises_compression(self):
+        """Test that requests advertise every encoding urllib3 can decode."""
+        from urllib3.util import make_headers
+
+        client = RawClient("https://api.example.com", "key-123")
+
+        advertised = client._http_client.headers["Accept-Encoding"].replace(" ", "").split(",")
+        assert "gzip" in advertised
+        assert advertised == make_headers(accept_encoding=True)["accept-encoding"].split(",")
+
+    def test_custom_adapter_is_mounted(self):
+        """Test that with_http_adapter replaces the default transport adapter."""
+        from requests.adapters import HTTPAdapter
+        from moi.options import with_http_adapter
+
+        adapter = HTTPAdapter(max_retries=2)
+        client = RawClient("https://api.example.com", "key-123", with_http_adapter(adapter))
+
+        assert client._http_client.get_adapter("https://api.example.com") is adapter
+        assert client._http_client.get_adapter("http://api.example.com") is adapter
+
+    def test_custom_session_is_left_untouched(self):
+        """Test that a caller-provided session keeps its own adapters."""
+        import requests
+        from moi.options import with_http_client
+
+        session = requests.Session()
+        original = session.get_adapter("https://api.example.com")
+        client = RawClient("https://api.example.com", "key-123", with_http_client(session))
+
+        assert client._http_client.get_adapter("https://api.example.com") is original
+
+
+class TestClose:
+    """Test closing clients and using them as context managers."""
+
+    class _Session:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    def test_close_owned_session(self):
+        """Test that closing the client closes the session it created."""
+        with RawClient("https://api.example.com", "key-123") as client:
+            session = client._http_client
+            session.close = lambda: setattr(session, "was_closed", True)
+        assert session.was_closed
+
+    def test_close_leaves_shared_sessions_open(self):
+        """Test that caller-provided sessions and clones are not closed."""
+        from moi.options import with_http_client
+
+        session = self._Session()
+        client = RawClient("https://api.example.com", "key-123", with_http_client(session))
+        client.close()
+        assert not session.closed
+
+        owner = RawClient("https://api.example.com", "key-123")
+        owner._http_client = shared = self._Session()
+        owner.with_special_user("key-456").close()
+        assert not shared.closed
+
+    def test_sdk_client_closes_raw(self):
+        """Test that SDKClient delegates close to its RawClient."""
+        raw = RawClient("https://api.example.com", "key-123")
+        raw._http_client = session = self._Session()
+        with SDKClient(raw) as sdk:
+            assert sdk.raw is raw
+        assert session.closed
+
+
+class TestSlots:
+    """Test that client and option objects use __slots__."""
+
+    def test_raw_client_has_no_instance_dict(self):
+        """Test that RawClient and its clones are slotted."""
+        client = RawClient("https://api.example.com", "key-123")
+        cloned = client.with_special_user("key-456")
+
+        assert not hasattr(client, "__dict__")
+        assert not hasattr(cloned, "__dict__")
+        with pytest.raises(AttributeError):
+            client.unexpected = 1
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_options_are_slotted(self):
+        """Test that option dataclasses are slotted where supported."""
+        from moi.options import ClientOptions, CallOptions
+
+        assert not hasattr(ClientOptions(), "__dict__")
+        assert not hasattr(CallOptions(), "__dict__")
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_response_models_are_slotted(self):
+        """Test that response models are slotted where supported."""
+        from moi.models import VolumeChildrenResponse, DatabaseChildrenResponse, FullPath
+
+        assert "__dict__" not in dir(VolumeChildrenResponse)
+        assert "__dict__" not in dir(DatabaseChildrenResponse)
+        assert not hasattr(FullPath(), "__dict__")
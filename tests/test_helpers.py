@@ -1,7 +1,10 @@
 """Test helpers for MOI Python SDK tests."""
 
+import base64
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 import pytest
 from moi import RawClient
 
@@ -20,8 +23,8 @@ def get_test_client():
 
 
 def random_name(prefix: str = "test-") -> str:
-    """Generate a random name for testing using timestamp."""
-    return f"{prefix}{int(time.time() * 1_000_000_000)}"
+    """Generate a random name for testing with an 8-character base32 suffix."""
+    return f"{prefix}{base64.b32encode(os.urandom(5)).decode('ascii').lower()}"
 
 
 def random_user_name() -> str:
@@ -29,16 +32,49 @@ def random_user_name() -> str:
     return f"sdkuser{int(time.time() * 1_000_000_000)}"
 
 
+class CleanupGroup:
+    """Collects cleanup calls registered by a test; see cleanup_group."""
+
+    def __init__(self):
+        self._calls = []
+
+    def add(self, func, *args):
+        """Register func(*args) to run when the group exits."""
+        self._calls.append((func, args))
+
+
+def swallow(func, *args):
+    """Call func(*args), ignoring any exception; for best-effort test cleanup."""
+    try:
+        func(*args)
+    except Exception:
+        pass
+
+
+def _call_quietly(call):
+    func, args = call
+    swallow(func, *args)
+
+
+@contextmanager
+def cleanup_group(max_workers: int = 4):
+    """Run registered cleanup calls concurrently on exit, ignoring their errors."""
+    group = CleanupGroup()
+    try:
+        yield group
+    finally:
+        if group._calls:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                list(pool.map(_call_quietly, group._calls))
+
+
 def create_test_catalog(client: RawClient):
     """Create a test catalog and return its ID and cleanup function."""
     resp = client.create_catalog({"name": random_name("sdk-cat-")})
     catalog_id = resp["id"]
     
     def cleanup():
-        try:
-            client.delete_catalog({"id": catalog_id})
-        except Exception:
-            pass
+        swallow(client.delete_catalog, {"id": catalog_id})
     
     return catalog_id, cleanup
 
@@ -52,10 +88,7 @@ def create_test_database(client: RawClient, catalog_id: int):
     database_id = resp["id"]
     
     def cleanup():
-        try:
-            client.delete_database({"id": database_id})
-        except Exception:
-            pass
+        swallow(client.delete_database, {"id": database_id})
     
     return database_id, cleanup
 
@@ -70,10 +103,7 @@ def create_test_volume(client: RawClient, database_id: int):
     volume_id = resp["id"]
     
     def cleanup():
-        try:
-            client.delete_volume({"id": volume_id})
-        except Exception:
-            pass
+        swallow(client.delete_volume, {"id": volume_id})
     
     return volume_id, cleanup
 
@@ -94,10 +124,7 @@ def create_test_table(client: RawClient, database_id: int):
     table_id = resp["id"]
     
     def cleanup():
-        try:
-            client.delete_table({"id": table_id})
-        except Exception:
-            pass
+        swallow(client.delete_table, {"id": table_id})
     
     return table_id, cleanup
 
@@ -117,10 +144,7 @@ def create_test_role(client: RawClient, priv_codes: list):
     role_id = resp["id"]
     
     def cleanup():
-        try:
-            client.delete_role({"id": role_id})
-        except Exception:
-            pass
+        swallow(client.delete_role, {"id": role_id})
     
     return role_id, cleanup
 
@@ -0,0 +1,157 @@
+"""Tests for the top-level moi package exports."""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+import warnings
+
+import pytest
+
+import moi
+
+
+def _run_python(code):
+    """Run code in a fresh interpreter and return its stripped stdout."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout.strip()
+
+
+class TestLazyExports:
+    """Test lazy loading of package-level names."""
+
+    def test_import_loads_no_submodules(self):
+        """Test that importing moi only loads the version module."""
+        output = _run_python(
+            "import sys, moi; "
+            "print(sorted(m for m in sys.modules if m.startswith('moi.')))"
+        )
+        assert output == "['moi._version']"
+
+    def test_access_loads_owning_submodule(self):
+        """Test that accessing a name imports only what it needs."""
+        output = _run_python(
+            "import sys, moi; moi.ErrNilRequest; "
+            "print('moi.errors' in sys.modules, 'moi.client' in sys.modules)"
+        )
+        assert output == "True False"
+
+    def test_models_not_loaded_for_non_model_names(self):
+        """Test that error and model names do not drag in unrelated modules."""
+        output = _run_python(
+            "import sys, moi; moi.APIError; moi.QuestionType; "
+            "print('moi.models' in sys.modules, 'requests' in sys.modules)"
+        )
+        assert output == "True False"
+        output = _run_python(
+            "import sys, moi; moi.APIError; "
+            "print('moi.models' in sys.modules)"
+        )
+        assert output == "False"
+
+    def test_raw_client_does_not_load_stream(self):
+        """Test that RawClient defers the streaming module until it is used."""
+        output = _run_python(
+            "import sys, moi; moi.RawClient; "
+            "print('moi.stream' in sys.modules)"
+        )
+        assert output == "False"
+
+    def test_all_names_resolve(self):
+        """Test that every name in __all__ resolves to its submodule object."""
+        for name in moi.__all__:
+            value = getattr(moi, name)
+            assert value is not None
+            assert name in vars(moi)
+
+    def test_all_is_constant_tuple_matching_lazy_map(self):
+        """Test that __all__ is a duplicate-free tuple covering the lazy map."""
+        assert isinstance(moi.__all__, tuple)
+        assert len(set(moi.__all__)) == len(moi.__all__)
+        assert set(moi.__all__) == set(moi._LAZY)
+
+    def test_resolved_name_matches_submodule(self):
+        """Test that lazy names are the same objects as the submodule ones."""
+        from moi.client import RawClient
+
+        assert moi.RawClient is RawClient
+
+    def test_first_access_binds_whole_group(self):
+        """Test that touching one error class binds all of them at once."""
+        output = _run_python(
+            "import moi; moi.APIError; "
+            "print(all(n in vars(moi) for n in "
+            "('HTTPError', 'ErrBaseURLRequired', 'ErrAPIKeyRequired', 'ErrNilRequest')))"
+        )
+        assert output == "True"
+
+    def test_unknown_attribute_raises(self):
+        """Test that unknown names raise AttributeError."""
+        with pytest.raises(AttributeError):
+            moi.DoesNotExist
+
+    def test_deprecated_name_warns_once(self, monkeypatch):
+        """Test that a deprecated alias warns on first access only."""
+        monkeypatch.setattr(
+            moi,
+            "_DEPRECATED",
+            {"OldClient": ("client", "RawClient", "Use RawClient instead")},
+        )
+        try:
+            with pytest.warns(DeprecationWarning, match="Use RawClient instead"):
+                value = moi.OldClient
+            assert value is moi.RawClient
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                assert moi.OldClient is moi.RawClient
+        finally:
+            vars(moi).pop("OldClient", None)
+
+    def test_star_import_excludes_deprecated_names(self):
+        """Test that star-import exports only the documented surface."""
+        output = _run_python(
+            "import warnings; warnings.simplefilter('error'); "
+            "ns = {}; exec('from moi import *', ns); "
+            "import moi; "
+            "print(sorted(set(ns) - {'__builtins__'}) == sorted(moi.__all__), "
+            "any(n in ns for n in moi._DEPRECATED))"
+        )
+        assert output == "True False"
+
+    def test_lazy_map_is_read_only(self):
+        """Test that the name-to-submodule map cannot be mutated."""
+        with pytest.raises(TypeError):
+            moi._LAZY["RawClient"] = "stream"
+
+    def test_version_matches_version_module(self):
+        """Test that __version__ comes from moi._version."""
+        from moi._version import __version__
+
+        assert moi.__version__ == __version__
+
+    def test_dir_lists_exports(self):
+        """Test that dir() includes not-yet-loaded exports."""
+        assert set(moi.__all__) <= set(dir(moi))
+
+
+class TestTypeStub:
+    """Test the static stub that mirrors the lazy exports."""
+
+    def test_stub_declares_every_export(self):
+        """Test that __init__.pyi re-exports exactly the names in __all__."""
+        stub = Path(moi.__file__).with_suffix(".pyi")
+        tree = ast.parse(stub.read_text(encoding="utf-8"))
+        declared = {
+            alias.asname
+            for node in tree.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+        assert declared - {"__version__"} == set(moi.__all__)
+        assert (stub.parent / "py.typed").exists()
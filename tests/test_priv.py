@@ -392,3 +392,32 @@ class TestTableRowColExpression_ExpressionArray:
         assert len(json_map["expression"]) == 3
         assert "^test.*" in json_map["expression"]
 
+
+
+class TestObjTypeNames:
+    """Test ObjType string names."""
+
+    def test_str_uses_lowercase_names(self):
+        """Test that every member maps to its snake_case name and NONE to 'none'."""
+        from moi.models import ObjType
+
+        assert str(ObjType.TABLE) == "table"
+        assert str(ObjType.DATA_CENTER) == "data_center"
+        assert str(ObjType.NONE) == "none"
+        for member in ObjType:
+            if member is not ObjType.NONE:
+                assert str(member) == member.name.lower()
+
+
+class TestCheckPrivEquality:
+    """Test CheckPriv comparisons."""
+
+    def test_eq_compares_fields(self):
+        """Test that CheckPriv compares by priv_id and obj_id only."""
+        from moi.models import CheckPriv
+
+        assert CheckPriv(1, "t1") == CheckPriv(1, "t1")
+        assert CheckPriv(1, "t1") != CheckPriv(2, "t1")
+        assert CheckPriv(1, "t1") != CheckPriv(1, "t2")
+        assert CheckPriv(1, "t1") != (1, "t1")
+        assert CheckPriv(1, "t1") in [CheckPriv(0, "x"), CheckPriv(1, "t1")]
@@ -0,0 +1,744 @@
+"""Offline tests for RawClient request building and response parsing."""
+
+import io
+import json
+import re
+
+import pytest
+import requests
+
+from moi import RawClient, APIError, HTTPError, ErrNilRequest
+from moi import _json
+from moi._multipart import MultipartStream
+from moi.options import CallOptions, with_http_client
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response."""
+
+    def __init__(self, status_code=200, payload=None, content=None):
+        self.status_code = status_code
+        if content is None:
+            content = json.dumps(payload).encode("utf-8")
+        self.content = content
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Session double that records requests and returns canned responses."""
+
+    def __init__(self, response=None):
+        self.calls = []
+        self.response = response or FakeResponse(payload={"code": "OK", "data": {"ok": True}})
+
+    def request(self, method=None, **kwargs):
+        kwargs["method"] = method or kwargs.get("method")
+        self.calls.append(kwargs)
+        return self.response
+
+
+def make_client(response=None):
+    """Create a RawClient backed by a FakeSession."""
+    session = FakeSession(response)
+    client = RawClient("https://api.example.com", "test-key", with_http_client(session))
+    return client, session
+
+
+def multipart_parts(call):
+    """Split a streamed multipart request body into (name, filename, value) tuples."""
+    boundary = call["headers"]["Content-Type"].split("boundary=")[1].encode()
+    parts = []
+    for chunk in call["data"].read().split(b"--" + boundary)[1:-1]:
+        head, _, value = chunk[2:-2].partition(b"\r\n\r\n")
+        name = re.search(rb'name="([^"]*)"', head).group(1).decode()
+        filename = re.search(rb'filename="([^"]*)"', head)
+        parts.append((name, filename and filename.group(1).decode(), value))
+    return parts
+
+
+@pytest.fixture(params=["json", "orjson"])
+def json_backend(request, monkeypatch):
+    """Reload moi._json with the stdlib-only or the orjson backend."""
+    import importlib
+    import sys
+
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setitem(sys.modules, "orjson", None)
+    yield importlib.reload(_json)
+    monkeypatch.undo()
+    importlib.reload(_json)
+
+
+class TestJSONCodec:
+    """Test the JSON helpers used on the request hot path."""
+
+    def test_backends_encode_and_decode_alike(self, json_backend):
+        """Test that payloads encode to the same values with and without orjson."""
+        from datetime import datetime
+
+        from moi.models import FullPath, ObjType
+
+        payload = {
+            "obj_type": ObjType.TABLE,
+            "created_at": datetime(2024, 1, 1),
+            "name": "表",
+            "ids": [1, 2],
+            "path": FullPath(id_list=["1"], name_list=["db"]),
+        }
+        expected = {
+            "obj_type": "table",
+            "created_at": "2024-01-01 00:00:00",
+            "name": "表",
+            "ids": [1, 2],
+            "path": {"id_list": ["1"], "name_list": ["db"]},
+        }
+
+        encoded = json_backend.dumps(payload)
+
+        assert json.loads(encoded) == expected
+        assert json_backend.loads(encoded) == expected
+        assert json_backend.loads(encoded.decode("utf-8")) == expected
+
+    def test_dumps_returns_bytes(self):
+        """Test that dumps always returns UTF-8 bytes."""
+        encoded = _json.dumps({"name": "表", "id": 1})
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == {"name": "表", "id": 1}
+
+    def test_dumps_falls_back_to_str(self):
+        """Test that unknown types are stringified."""
+        class Custom:
+            def __str__(self):
+                return "custom"
+
+        assert json.loads(_json.dumps({"value": Custom()})) == {"value": "custom"}
+
+    def test_loads_bad_input_raises_json_decode_error(self):
+        """Test that invalid JSON raises the stdlib-compatible error type."""
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads(b"not json")
+
+
+class TestDoJSON:
+    """Test JSON request encoding and envelope decoding."""
+
+    def test_body_is_sent_as_json_bytes(self):
+        """Test that request bodies are encoded to bytes."""
+        client, session = make_client()
+
+        result = client.post_json("/catalog/info", {"catalog_id": 1})
+
+        assert result == {"ok": True}
+        call = session.calls[0]
+        assert isinstance(call["data"], bytes)
+        assert json.loads(call["data"]) == {"catalog_id": 1}
+        assert call["headers"]["Content-Type"] == "application/json"
+
+    def test_api_error_is_raised(self):
+        """Test that a non-OK envelope raises APIError."""
+        client, _ = make_client(FakeResponse(payload={"code": "ErrInternal", "msg": "boom"}))
+
+        with pytest.raises(APIError) as exc_info:
+            client.post_json("/catalog/info", {"catalog_id": 1})
+        assert exc_info.value.code == "ErrInternal"
+
+    def test_invalid_json_raises_http_error(self):
+        """Test that an undecodable body raises HTTPError."""
+        client, _ = make_client(FakeResponse(content=b"<html>"))
+
+        with pytest.raises(HTTPError):
+            client.post_json("/catalog/info", {"catalog_id": 1})
+
+
+class TestBuildHeaders:
+    """Test request header construction."""
+
+    def test_json_headers_without_overrides(self):
+        """Test the default JSON header set."""
+        client, _ = make_client()
+        headers = client._build_headers(CallOptions(), "application/json")
+
+        assert headers["moi-key"] == "test-key"
+        assert headers["Content-Type"] == "application/json"
+        assert headers["Accept"] == "application/json"
+        assert "X-Request-ID" not in headers
+
+    def test_json_headers_are_not_shared(self):
+        """Test that callers can mutate the returned headers safely."""
+        client, _ = make_client()
+        first = client._build_headers(CallOptions(), "application/json")
+        first["Accept"] = "text/event-stream"
+
+        second = client._build_headers(CallOptions(), "application/json")
+        assert second["Accept"] == "application/json"
+
+    def test_plain_headers_without_overrides(self):
+        """Test that requests without a content type get a copy of the base set."""
+        client, _ = make_client()
+
+        headers = client._build_headers(CallOptions())
+        headers["X-Extra"] = "1"
+
+        assert "Content-Type" not in headers
+        assert "X-Extra" not in client._build_headers(CallOptions())
+        assert client._build_headers(CallOptions())["moi-key"] == "test-key"
+
+    def test_call_overrides_apply(self):
+        """Test that request ID and per-call headers override defaults."""
+        client, _ = make_client()
+        call_opts = CallOptions(headers={"moi-key": "other"}, request_id="req-1")
+        headers = client._build_headers(call_opts, "application/json")
+
+        assert headers["moi-key"] == "other"
+        assert headers["X-Request-ID"] == "req-1"
+
+    def test_cloned_client_uses_new_key(self):
+        """Test that with_special_user rebuilds the cached headers."""
+        client, _ = make_client()
+        cloned = client.with_special_user("new-key")
+
+        assert cloned._build_headers(CallOptions(), "application/json")["moi-key"] == "new-key"
+        assert client._build_headers(CallOptions(), "application/json")["moi-key"] == "test-key"
+
+
+class TestResolveCallOptions:
+    """Test call option resolution."""
+
+    def test_no_options_share_empty_instance(self):
+        """Test that calls without options reuse one empty CallOptions."""
+        from moi.client import _resolve_call_opts
+
+        assert _resolve_call_opts(()) is _resolve_call_opts(())
+        assert _resolve_call_opts(()).headers == {}
+
+    def test_options_get_fresh_instance(self):
+        """Test that options never leak into the shared instance."""
+        from moi.client import _resolve_call_opts
+        from moi.options import with_header
+
+        resolved = _resolve_call_opts((None, with_header("X-Test", "1")))
+
+        assert resolved.headers == {"X-Test": "1"}
+        assert _resolve_call_opts(()).headers == {}
+
+
+class TestBuildURL:
+    """Test URL construction."""
+
+    def test_path_without_leading_slash(self):
+        """Test that relative paths are joined to the base URL."""
+        client, _ = make_client()
+        assert client._build_url("catalog/list") == "https://api.example.com/catalog/list"
+
+    def test_query_params_skip_none_and_expand_lists(self):
+        """Test query encoding of scalars, None and sequences."""
+        client, _ = make_client()
+        url = client._build_url(
+            "/task/get",
+            {"task_id": 7, "skip": None, "ids": [1, 2], "flag": True},
+        )
+        assert url == "https://api.example.com/task/get?task_id=7&ids=1&ids=2&flag=True"
+
+    def test_repeated_path_is_stable(self):
+        """Test that cached joins return the same URL."""
+        client, _ = make_client()
+        assert client._build_url("/catalog/info") == client._build_url("/catalog/info")
+
+    def test_base_url_path_matches_previous_join(self):
+        """Test that absolute paths resolve against scheme and host only."""
+        client = RawClient("https://api.example.com/prefix/", "test-key")
+        assert client._build_url("/catalog/list") == "https://api.example.com/catalog/list"
+        assert client.with_special_user("k2")._build_url("x") == "https://api.example.com/x"
+
+
+class TestDataclassBodies:
+    """Test that dataclass request bodies are serialized without asdict."""
+
+    def test_nested_dataclasses_are_encoded(self):
+        """Test nested dataclasses and lists of dataclasses."""
+        from moi.models import FullPath, TableRowColRule, TableRowColExpression
+
+        rule = TableRowColRule(
+            column="region",
+            relation="and",
+            expression_list=[TableRowColExpression(operator="=", expression=["east"])],
+        )
+        encoded = json.loads(_json.dumps({"path": FullPath(id_list=["1"]), "rule": rule}))
+
+        assert encoded["path"] == {"id_list": ["1"], "name_list": []}
+        assert encoded["rule"]["expression_list"] == [
+            {"operator": "=", "expression": ["east"], "match_type": ""}
+        ]
+
+    def test_dataclass_request_body(self):
+        """Test that a dataclass passed to post_json is sent as JSON."""
+        from moi.models import CatalogCreateRequest
+
+        client, session = make_client()
+        client.post_json("/catalog/create", CatalogCreateRequest(catalog_name="c1"))
+
+        assert json.loads(session.calls[0]["data"])["catalog_name"] == "c1"
+
+
+class TestGeneratedEndpoints:
+    """Test the table-driven POST endpoint methods."""
+
+    def test_endpoint_posts_to_path(self):
+        """Test that a generated method POSTs the payload to its path."""
+        client, session = make_client()
+
+        client.create_volume({"name": "v1"})
+
+        call = session.calls[0]
+        assert call["method"] == "POST"
+        assert call["url"] == "https://api.example.com/catalog/volume/create"
+        assert json.loads(call["data"]) == {"name": "v1"}
+
+    def test_endpoint_requires_payload(self):
+        """Test that a None payload raises ErrNilRequest naming the method."""
+        client, session = make_client()
+
+        with pytest.raises(ErrNilRequest, match="delete_folder requires a request payload"):
+            client.delete_folder(None)
+        assert session.calls == []
+
+    def test_endpoint_metadata(self):
+        """Test that generated methods keep their names and docstrings."""
+        assert RawClient.create_catalog.__name__ == "create_catalog"
+        assert RawClient.create_catalog.__doc__ == "Create a new catalog."
+
+    def test_endpoints_share_code(self):
+        """Test that endpoints outside the catalog tree use the shared body too."""
+        code = RawClient.create_catalog.__code__
+        for name in (
+            "run_nl2sql",
+            "search_knowledge",
+            "list_role_logs",
+            "list_objects_by_category",
+            "create_user",
+            "update_my_password",
+            "list_roles_by_category_and_object",
+        ):
+            assert getattr(RawClient, name).__code__ is code
+
+        client, session = make_client()
+        client.list_user_logs({"page": 1})
+        assert session.calls[0]["url"] == "https://api.example.com/log/user"
+
+
+class TestMultipartStream:
+    """Test the streaming multipart encoder against requests' own encoding."""
+
+    @staticmethod
+    def _requests_body(data, files):
+        prepared = requests.Request(
+            "POST", "https://api.example.com/upload", data=data, files=files
+        ).prepare()
+        boundary = prepared.headers["Content-Type"].split("boundary=")[1]
+        return prepared.body, boundary
+
+    def test_matches_requests_encoding(self, tmp_path):
+        """Test that streamed output is byte-identical to requests."""
+        file_path = tmp_path / "数据.csv"
+        file_path.write_bytes(b"a,b\n1,2\n" * 1000)
+        data = {"meta": '[{"filename": "数据.csv"}]', "count": 2, "skip": None}
+
+        with file_path.open("rb") as handle:
+            expected, boundary = self._requests_body(data, [("file", ("数据.csv", handle))])
+        with file_path.open("rb") as handle:
+            stream = MultipartStream.build(data, [("file", ("数据.csv", handle))], boundary=boundary)
+            assert stream is not None
+            assert len(stream) == len(expected)
+            assert stream.read() == expected
+
+    def test_small_reads_reassemble_body(self, tmp_path):
+        """Test that chunked reads produce the same bytes as one read."""
+        file_path = tmp_path / "a.bin"
+        file_path.write_bytes(bytes(range(256)) * 50)
+        files = {"file": ("a.bin", None), "__empty": ("", b"")}
+
+        with file_path.open("rb") as handle:
+            files["file"] = ("a.bin", handle)
+            expected, boundary = self._requests_body({}, files)
+        with file_path.open("rb") as handle:
+            files["file"] = ("a.bin", handle)
+            stream = MultipartStream.build({}, files, boundary=boundary)
+            chunks = []
+            while True:
+                chunk = stream.read(1000)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        assert b"".join(chunks) == expected
+
+    def test_in_memory_streams_are_sized(self):
+        """Test that seekable in-memory files stream from their current position."""
+        handle = io.BytesIO(b"skip:payload")
+        handle.read(5)
+
+        stream = MultipartStream.build({}, [("file", ("a.bin", handle))])
+
+        assert stream is not None
+        body = stream.read()
+        assert len(body) == len(stream)
+        assert b"\r\n\r\npayload\r\n" in body
+
+    def test_unsized_file_falls_back(self):
+        """Test that file objects without a known size are not streamed."""
+        class Reader:
+            def read(self, size=-1):
+                return b""
+
+        assert MultipartStream.build({}, [("file", ("x", Reader()))]) is None
+
+    def test_post_multipart_streams_disk_files(self, tmp_path):
+        """Test that post_multipart sends a sized stream for disk files."""
+        file_path = tmp_path / "a.txt"
+        file_path.write_bytes(b"hello")
+        client, session = make_client()
+
+        with file_path.open("rb") as handle:
+            client.post_multipart("/connectors/file/upload", [("file", ("a.txt", handle))], {"meta": "[]"})
+            call = session.calls[0]
+            assert isinstance(call["data"], MultipartStream)
+            assert b"hello" in call["data"].read()
+
+        assert "files" not in call
+        assert call["headers"]["Content-Type"].startswith("multipart/form-data; boundary=")
+
+
+class TestNormalizeFileItems:
+    """Test validation of (fileobj, filename) upload items."""
+
+    def test_well_formed_items(self):
+        """Test that tuples and lists are converted to requests' format."""
+        handle = object()
+        assert RawClient._normalize_file_items([(handle, "a.txt"), [handle, "b.txt"]], "files") == [
+            ("files", ("a.txt", handle)),
+            ("files", ("b.txt", handle)),
+        ]
+
+    @pytest.mark.parametrize(
+        "item, message",
+        [
+            ("a.txt", "file item at index 0 must be a \\(fileobj, filename\\) tuple"),
+            ((None, "a.txt"), "file object at index 0 cannot be None"),
+            ((object(), ""), "filename at index 0 cannot be empty"),
+        ],
+    )
+    def test_invalid_items(self, item, message):
+        """Test that malformed items raise a ValueError naming the index."""
+        with pytest.raises(ValueError, match=message):
+            RawClient._normalize_file_items([item])
+
+
+class TestRawJSONResponses:
+    """Test endpoints that decode non-enveloped JSON bodies."""
+
+    def test_health_check_decodes_body(self):
+        """Test that health_check returns the decoded JSON body."""
+        client, _ = make_client(FakeResponse(payload={"status": "ok"}))
+        assert client.health_check() == {"status": "ok"}
+
+    def test_llm_proxy_decodes_json(self):
+        """Test that LLM proxy calls decode JSON from the raw bytes."""
+        client, session = make_client(FakeResponse(payload={"id": 1, "title": "会话"}))
+
+        assert client.create_llm_session({"title": "会话"}) == {"id": 1, "title": "会话"}
+        assert session.calls[0]["url"].startswith("https://api.example.com/llm-proxy/")
+
+    def test_llm_proxy_returns_text_for_non_json(self):
+        """Test that non-JSON success bodies are returned as text."""
+        client, _ = make_client(FakeResponse(content=b"plain text"))
+        assert client.create_llm_session({"title": "t"}) == "plain text"
+
+    def test_llm_proxy_error_envelope(self):
+        """Test that LLM proxy error bodies raise APIError."""
+        response = FakeResponse(400, {"error": {"code": "bad_request", "message": "nope"}})
+        client, _ = make_client(response)
+
+        with pytest.raises(APIError) as exc_info:
+            client.create_llm_session({"title": "t"})
+        assert exc_info.value.code == "bad_request"
+
+
+class TestEmptyBodyPosts:
+    """Test the parameterless POST endpoints."""
+
+    def test_list_catalogs_sends_constant_body(self):
+        """Test that list_catalogs POSTs {} with JSON headers."""
+        client, session = make_client()
+
+        client.list_catalogs()
+
+        call = session.calls[0]
+        assert call["url"] == "https://api.example.com/catalog/list"
+        assert call["data"] == b"{}"
+        assert call["headers"]["Content-Type"] == "application/json"
+        assert call["headers"]["moi-key"] == "test-key"
+
+    def test_options_use_regular_path(self):
+        """Test that call options are still honored."""
+        from moi.options import with_request_id
+
+        client, session = make_client()
+
+        client.get_table_overview(with_request_id("req-9"))
+
+        call = session.calls[0]
+        assert call["url"] == "https://api.example.com/catalog/table/overview"
+        assert call["headers"]["X-Request-ID"] == "req-9"
+        assert json.loads(call["data"]) == {}
+
+
+class TestUploadLocalFiles:
+    """Test connector uploads of local files."""
+
+    def test_single_request_by_default(self):
+        """Test that all files share one multipart request by default."""
+        client, session = make_client()
+
+        client.upload_local_files(
+            [(io.BytesIO(b"a"), "a.txt"), (io.BytesIO(b"b"), "b.txt")],
+            [{"filename": "a.txt"}, {"filename": "b.txt"}],
+        )
+
+        assert len(session.calls) == 1
+        parts = multipart_parts(session.calls[0])
+        assert [(name, filename) for name, filename, _ in parts] == [
+            ("meta", None),
+            ("file", "a.txt"),
+            ("file", "b.txt"),
+        ]
+
+    def test_parallel_uploads_return_results_in_order(self):
+        """Test that max_workers fans out one request per file."""
+        client, session = make_client()
+
+        results = client.upload_local_files(
+            [(io.BytesIO(b"a"), "a.txt"), (io.BytesIO(b"b"), "b.txt")],
+            [{"filename": "a.txt"}, {"filename": "b.txt"}],
+            max_workers=2,
+        )
+
+        assert results == [{"ok": True}, {"ok": True}]
+        assert len(session.calls) == 2
+        metas = sorted(
+            json.loads(multipart_parts(call)[0][2])[0]["filename"] for call in session.calls
+        )
+        assert metas == ["a.txt", "b.txt"]
+
+    def test_parallel_uploads_require_matching_meta(self):
+        """Test that per-file uploads need one meta entry per file."""
+        client, _ = make_client()
+
+        with pytest.raises(ValueError, match="one entry per file"):
+            client.upload_local_files(
+                [(io.BytesIO(b"a"), "a.txt"), (io.BytesIO(b"b"), "b.txt")],
+                [{"filename": "a.txt"}],
+                max_workers=2,
+            )
+
+    def test_call_options_are_applied(self):
+        """Test that call options reach the multipart request."""
+        from moi.options import with_request_id
+
+        client, session = make_client()
+
+        client.upload_local_file(io.BytesIO(b"a"), "a.txt", [{"filename": "a.txt"}], with_request_id("r-1"))
+
+        assert session.calls[0]["headers"]["X-Request-ID"] == "r-1"
+
+
+class TestMultipartJSONFields:
+    """Test that JSON form fields are encoded with the shared codec."""
+
+    def test_connector_fields_are_json_bytes(self):
+        """Test that connector upload fields are sent as encoded JSON bytes."""
+        client, session = make_client()
+
+        client.upload_connector_file(
+            "vol-1",
+            file_items=[(io.BytesIO(b"a"), "a.csv")],
+            meta=[{"filename": "a.csv"}],
+            table_config={"table_id": 1},
+        )
+
+        fields = {name: value for name, filename, value in multipart_parts(session.calls[0]) if filename is None}
+        assert json.loads(fields["meta"]) == [{"filename": "a.csv"}]
+        assert json.loads(fields["table_config"]) == {"table_id": 1}
+
+
+class TestTypedResponses:
+    """Test resp_type decoding of envelope data."""
+
+    def test_dict_and_list_data(self):
+        """Test that dicts and list items are converted to resp_type."""
+        from moi.models import FullPath
+
+        client, _ = make_client(FakeResponse(payload={"code": "OK", "data": {"id_list": ["1"]}}))
+        assert client.post_json("/x", {}, FullPath) == FullPath(id_list=["1"])
+
+        client, _ = make_client(
+            FakeResponse(payload={"code": "OK", "data": [{"id_list": ["1"]}, "raw"]})
+        )
+        assert client.post_json("/x", {}, FullPath) == [FullPath(id_list=["1"]), "raw"]
+
+
+class FakeStreamResponse(FakeResponse):
+    """Streaming response double supporting iter_content and with-blocks."""
+
+    def __init__(self, chunks, status_code=200):
+        super().__init__(status_code, content=b"".join(chunks))
+        self.chunks = chunks
+        self.closed = False
+
+    def iter_content(self, chunk_size=1):
+        return iter(self.chunks)
+
+    def close(self):
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TestStreamingDownloads:
+    """Test get_raw streaming and download_to_file."""
+
+    def test_get_raw_streams(self):
+        """Test that get_raw asks requests for a streaming response."""
+        client, session = make_client(FakeStreamResponse([b"abc"]))
+        client.get_raw("/file")
+        assert session.calls[0]["stream"] is True
+
+    def test_get_raw_close_returns_connection(self):
+        """Test that closing an unread get_raw response frees its pooled connection."""
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        from moi.client import _POOL_MAXSIZE
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                body = b"x" * 100000
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except ConnectionError:
+                    pass  # The client closed the response without reading it.
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            base_url = f"http://127.0.0.1:{server.server_port}"
+            client = RawClient(base_url, "key-123")
+            pools = client._http_client.get_adapter(base_url).poolmanager.pools
+
+            response = client.get_raw("/file")
+            assert response.status_code == 200
+            (key,) = pools.keys()
+            slots = pools[key].pool
+            assert slots.qsize() == _POOL_MAXSIZE - 1
+
+            response.close()
+            assert slots.qsize() == _POOL_MAXSIZE
+
+            with client.get_raw("/file") as response:
+                assert response.headers["Content-Length"] == "100000"
+                assert slots.qsize() == _POOL_MAXSIZE - 1
+            assert slots.qsize() == _POOL_MAXSIZE
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_get_raw_error_closes_response(self):
+        """Test that error responses are drained, closed and raised."""
+        response = FakeStreamResponse([b"boom"], status_code=500)
+        client, _ = make_client(response)
+        with pytest.raises(HTTPError):
+            client.get_raw("/file")
+        assert response.closed
+
+    def test_error_body_is_bounded(self):
+        """Test that only a bounded prefix of a large error body is read."""
+        from moi.client import _ERROR_BODY_LIMIT
+
+        response = FakeStreamResponse([b"x" * 50000, b"y" * 50000, b"z" * 50000], status_code=502)
+        client, _ = make_client(response)
+
+        with pytest.raises(HTTPError) as excinfo:
+            client.download_genai_result("file-1")
+
+        assert len(excinfo.value.body) == _ERROR_BODY_LIMIT
+        assert response.closed
+
+    def test_download_to_file(self, tmp_path):
+        """Test that chunks are written to disk and the response is closed."""
+        response = FakeStreamResponse([b"a,b\n", b"1,2\n"])
+        client, _ = make_client(response)
+        dest = tmp_path / "nested" / "out.csv"
+        assert client.download_to_file("/file", dest) == 8
+        assert dest.read_bytes() == b"a,b\n1,2\n"
+        assert response.closed
+
+
+class TestAPIEnvelope:
+    """Test the response envelope container."""
+
+    def test_from_json(self):
+        """Test that envelopes decode from bytes and fill defaults."""
+        from moi.response import APIEnvelope
+
+        envelope = APIEnvelope.from_json(b'{"code": "OK", "data": [1]}')
+        assert (envelope.code, envelope.msg, envelope.data, envelope.request_id) == ("OK", "", [1], "")
+        assert not hasattr(envelope, "__dict__")
+
+
+class TestGenAIJobs:
+    """Test concurrent GenAI job polling."""
+
+    def test_jobs_are_fetched_in_order(self):
+        """Test that every job is requested and results keep input order."""
+        class JobSession(FakeSession):
+            def request(self, method=None, **kwargs):
+                super().request(method, **kwargs)
+                job_id = kwargs["url"].rsplit("/", 1)[1]
+                return FakeResponse(payload={"code": "OK", "data": {"id": job_id}})
+
+        session = JobSession()
+        client = RawClient("https://api.example.com", "test-key", with_http_client(session))
+
+        results = client.get_genai_jobs(["j1", "j2", "j3"], max_workers=3)
+
+        assert results == [{"id": "j1"}, {"id": "j2"}, {"id": "j3"}]
+        assert sorted(call["url"] for call in session.calls) == [
+            "https://api.example.com/v1/genai/jobs/j1",
+            "https://api.example.com/v1/genai/jobs/j2",
+            "https://api.example.com/v1/genai/jobs/j3",
+        ]
+
+    def test_empty_job_id_is_rejected_before_requests(self):
+        """Test that validation happens before any job is fetched."""
+        client, session = make_client()
+
+        with pytest.raises(ValueError, match="job_id cannot be empty"):
+            client.get_genai_jobs(["j1", ""])
+        assert session.calls == []
+        assert client.get_genai_jobs([]) == []
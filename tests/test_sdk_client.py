@@ -1,6 +1,7 @@
 """Tests for SDKClient helper methods."""
 
 import os
+from contextlib import ExitStack
 import pytest
 from moi import SDKClient, ExistedTableOption, ExistedTableOptions
 from tests.test_helpers import (
@@ -43,11 +44,14 @@ class TestFindFilesByName:
         sdk = SDKClient(raw_client)
         
         # Step 1: Create test catalog, database, and volume
-        catalog_id, mark_catalog_deleted = create_test_catalog(raw_client)
-        database_id, mark_database_deleted = create_test_database(raw_client, catalog_id)
-        volume_id, mark_volume_deleted = create_test_volume(raw_client, database_id)
-        
-        try:
+        with ExitStack() as stack:
+            catalog_id, mark_catalog_deleted = create_test_catalog(raw_client)
+            stack.callback(mark_catalog_deleted)
+            database_id, mark_database_deleted = create_test_database(raw_client, catalog_id)
+            stack.callback(mark_database_deleted)
+            volume_id, mark_volume_deleted = create_test_volume(raw_client, database_id)
+            stack.callback(mark_volume_deleted)
+            
             # Step 2: Create a temporary test file with a specific name
             with tempfile.TemporaryDirectory() as tmpdir:
                 # Use the same file name format as in the user's example (without extension in search)
@@ -56,8 +60,8 @@ class TestFindFilesByName:
                 file_path = os.path.join(tmpdir, local_file_name)
                 test_content = "This is a test file for FindFilesByName integration test"
                 
-                with open(file_path, "w", encoding="utf-8") as f:
-                    f.write(test_content)
+                with open(file_path, "wb") as f:
+                    f.write(test_content.encode("utf-8"))
                 
                 # Ensure file exists
                 assert os.path.exists(file_path), "Temporary file should exist"
@@ -76,25 +80,29 @@ class TestFindFilesByName:
                 
                 # Step 4: Wait a bit for the file to be processed and indexed
                 # The file might need some time to be available in the file list
-                # We'll retry the search a few times with a short delay
+                # Retry with exponential backoff (0.1s, 0.2s, ... capped at 2s) until
+                # the file shows up or the deadline passes
                 found_files = None
-                max_retries = 10
-                retry_delay = 1.0
+                delay = 0.1
+                deadline = time.monotonic() + 20.0
+                attempt = 0
                 
-                for i in range(max_retries):
+                search = sdk.find_files_by_name
+                while time.monotonic() < deadline:
+                    attempt += 1
                     # Step 5: Search for the file using find_files_by_name
                     # Use the search file name (without extension) as in the user's example
                     try:
-                        found_files = sdk.find_files_by_name(search_file_name, volume_id)
+                        found_files = search(search_file_name, volume_id)
                         if found_files and found_files.get("total", 0) > 0:
-                            print(f"Found file after {i+1} retries")
+                            print(f"Found file after {attempt} attempt(s)")
                             break
                     except Exception as e:
-                        print(f"Search attempt {i+1} failed: {e}")
+                        print(f"Search attempt {attempt} failed: {e}")
                     
-                    if i < max_retries - 1:
-                        print(f"File not found yet, retrying in {retry_delay}s (attempt {i+1}/{max_retries})...")
-                        time.sleep(retry_delay)
+                    print(f"File not found yet, retrying in {delay}s (attempt {attempt})...")
+                    time.sleep(min(delay, max(0.0, deadline - time.monotonic())))
+                    delay = min(delay * 2, 2.0)
                 
                 # Step 6: Verify the search results
                 assert found_files is not None, "find_files_by_name should return a response"
@@ -114,10 +122,6 @@ class TestFindFilesByName:
                 
                 assert found, "Should find a file matching the uploaded file name"
                 print(f"Successfully found {found_files.get('total')} file(s) with search name '{search_file_name}'")
-        finally:
-            mark_volume_deleted()
-            mark_database_deleted()
-            mark_catalog_deleted()
 
 
 class TestImportLocalFileToTableExistedTableOption:
@@ -135,118 +139,409 @@ class TestImportLocalFileToTableExistedTableOption:
         sdk = SDKClient(raw_client)
         
         # Create test catalog, database, and table
-        catalog_id, mark_catalog_deleted = create_test_catalog(raw_client)
-        database_id, mark_database_deleted = create_test_database(raw_client, catalog_id)
-        table_id, mark_table_deleted = create_test_table(raw_client, database_id)
-        
-        try:
+        with ExitStack() as stack:
+            catalog_id, mark_catalog_deleted = create_test_catalog(raw_client)
+            stack.callback(mark_catalog_deleted)
+            database_id, mark_database_deleted = create_test_database(raw_client, catalog_id)
+            stack.callback(mark_database_deleted)
+            table_id, mark_table_deleted = create_test_table(raw_client, database_id)
+            stack.callback(mark_table_deleted)
+            
             # Create a test volume and upload a file to get conn_file_id
             volume_id, mark_volume_deleted = create_test_volume(raw_client, database_id)
+            stack.callback(mark_volume_deleted)
             
-            try:
-                # Create a temporary test file
-                with tempfile.TemporaryDirectory() as tmpdir:
-                    file_name = "test-import-table.csv"
-                    file_path = os.path.join(tmpdir, file_name)
-                    test_content = "id,name\n1,test1\n2,test2\n"
-                    
-                    with open(file_path, "w", encoding="utf-8") as f:
-                        f.write(test_content)
-                    
-                    # Upload file to volume to get conn_file_id
-                    upload_resp = sdk.import_local_file_to_volume(
-                        file_path,
-                        volume_id,
-                        {"filename": file_name, "path": file_name},
-                        None
-                    )
-                    assert upload_resp is not None
-                    assert upload_resp.get("file_id")
-                    conn_file_id = upload_resp.get("file_id")
-                    
-                    # Test 1: Import to existing table with ExistedTableOpts set to append
-                    table_config_append = {
-                        "conn_file_ids": [conn_file_id],
-                        "new_table": False,
-                        "table_id": table_id,
-                        "database_id": database_id,
-                        "existed_table": [
-                            {
-                                "tableColumn": "id",
-                                "column": "id",
-                                "col_num_in_file": 1,
-                            },
-                            {
-                                "tableColumn": "name",
-                                "column": "name",
-                                "col_num_in_file": 2,
-                            },
-                        ],
-                        "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.APPEND),
-                    }
-                    
-                    resp = sdk.import_local_file_to_table(table_config_append)
-                    # Note: The actual API call might fail if the file format doesn't match,
-                    # but we're testing that the ExistedTableOpts is properly set
-                    if resp is None:
-                        print("ImportLocalFileToTable with append option returned None (expected in some cases)")
-                    else:
-                        assert resp is not None
-                        print(f"Successfully imported with append option, response: {resp}")
-                    
-                    # Test 2: Import to existing table with ExistedTableOpts set to overwrite
-                    table_config_overwrite = {
-                        "conn_file_ids": [conn_file_id],
-                        "new_table": False,
-                        "table_id": table_id,
-                        "database_id": database_id,
-                        "existed_table": [
-                            {
-                                "tableColumn": "id",
-                                "column": "id",
-                                "col_num_in_file": 1,
-                            },
-                            {
-                                "tableColumn": "name",
-                                "column": "name",
-                                "col_num_in_file": 2,
-                            },
-                        ],
-                        "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.OVERWRITE),
-                    }
-                    
-                    resp2 = sdk.import_local_file_to_table(table_config_overwrite)
-                    if resp2 is None:
-                        print("ImportLocalFileToTable with overwrite option returned None (expected in some cases)")
-                    else:
-                        assert resp2 is not None
-                        print(f"Successfully imported with overwrite option, response: {resp2}")
-                    
-                    # Test 3: Import to existing table with existed_table as None (should be initialized to empty list internally)
-                    # Note: The method uses deepcopy, so the original dict won't be modified, but None should be handled correctly
-                    table_config_nil_existed_table = {
-                        "conn_file_ids": [conn_file_id],
-                        "new_table": False,
-                        "table_id": table_id,
-                        "database_id": database_id,
-                        "existed_table": None,  # None should be initialized to empty list internally
-                        "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.APPEND),
-                    }
-                    
-                    resp3 = sdk.import_local_file_to_table(table_config_nil_existed_table)
-                    # The method should handle None existed_table correctly by initializing it to empty list internally
-                    # Since the method uses deepcopy, the original dict remains unchanged
-                    # We just verify that the call doesn't raise an error
-                    
-                    if resp3 is None:
-                        print("ImportLocalFileToTable with None existed_table returned None (expected in some cases)")
-                    else:
-                        assert resp3 is not None
-                        print(f"Successfully imported with None existed_table (initialized internally), response: {resp3}")
-            finally:
-                mark_volume_deleted()
-        finally:
-            mark_table_deleted()
-            mark_database_deleted()
-            mark_catalog_deleted()
+            # Create a temporary test file
+            with tempfile.TemporaryDirectory() as tmpdir:
+                file_name = "test-import-table.csv"
+                file_path = os.path.join(tmpdir, file_name)
+                test_content = "id,name\n1,test1\n2,test2\n"
+                
+                with open(file_path, "wb") as f:
+                    f.write(test_content.encode("utf-8"))
+                
+                # Upload file to volume to get conn_file_id
+                upload_resp = sdk.import_local_file_to_volume(
+                    file_path,
+                    volume_id,
+                    {"filename": file_name, "path": file_name},
+                    None
+                )
+                assert upload_resp is not None
+                assert upload_resp.get("file_id")
+                conn_file_id = upload_resp.get("file_id")
+                
+                # Test 1: Import to existing table with ExistedTableOpts set to append
+                table_config_append = {
+                    "conn_file_ids": [conn_file_id],
+                    "new_table": False,
+                    "table_id": table_id,
+                    "database_id": database_id,
+                    "existed_table": [
+                        {
+                            "tableColumn": "id",
+                            "column": "id",
+                            "col_num_in_file": 1,
+                        },
+                        {
+                            "tableColumn": "name",
+                            "column": "name",
+                            "col_num_in_file": 2,
+                        },
+                    ],
+                    "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.APPEND),
+                }
+                
+                resp = sdk.import_local_file_to_table(table_config_append)
+                # Note: The actual API call might fail if the file format doesn't match,
+                # but we're testing that the ExistedTableOpts is properly set
+                if resp is None:
+                    print("ImportLocalFileToTable with append option returned None (expected in some cases)")
+                else:
+                    assert resp is not None
+                    print(f"Successfully imported with append option, response: {resp}")
+                
+                # Test 2: Import to existing table with ExistedTableOpts set to overwrite
+                table_config_overwrite = {
+                    "conn_file_ids": [conn_file_id],
+                    "new_table": False,
+                    "table_id": table_id,
+                    "database_id": database_id,
+                    "existed_table": [
+                        {
+                            "tableColumn": "id",
+                            "column": "id",
+                            "col_num_in_file": 1,
+                        },
+                        {
+                            "tableColumn": "name",
+                            "column": "name",
+                            "col_num_in_file": 2,
+                        },
+                    ],
+                    "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.OVERWRITE),
+                }
+                
+                resp2 = sdk.import_local_file_to_table(table_config_overwrite)
+                if resp2 is None:
+                    print("ImportLocalFileToTable with overwrite option returned None (expected in some cases)")
+                else:
+                    assert resp2 is not None
+                    print(f"Successfully imported with overwrite option, response: {resp2}")
+                
+                # Test 3: Import to existing table with existed_table as None (should be initialized to empty list internally)
+                # Note: The method uses deepcopy, so the original dict won't be modified, but None should be handled correctly
+                table_config_nil_existed_table = {
+                    "conn_file_ids": [conn_file_id],
+                    "new_table": False,
+                    "table_id": table_id,
+                    "database_id": database_id,
+                    "existed_table": None,  # None should be initialized to empty list internally
+                    "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.APPEND),
+                }
+                
+                resp3 = sdk.import_local_file_to_table(table_config_nil_existed_table)
+                # The method should handle None existed_table correctly by initializing it to empty list internally
+                # Since the method uses deepcopy, the original dict remains unchanged
+                # We just verify that the call doesn't raise an error
+                
+                if resp3 is None:
+                    print("ImportLocalFileToTable with None existed_table returned None (expected in some cases)")
+                else:
+                    assert resp3 is not None
+                    print(f"Successfully imported with None existed_table (initialized internally), response: {resp3}")
+
+
+
+class _FakeRoleRaw:
+    """RawClient stand-in that serves a fixed role list."""
+
+    def __init__(self, roles):
+        self.roles = roles
+        self.list_calls = 0
+
+    def list_roles(self, request):
+        self.list_calls += 1
+        return {"role_list": list(self.roles), "total": len(self.roles)}
+
+    def create_role(self, payload):
+        self.roles.append({"id": 99, "name": payload["name"]})
+        return {"id": 99}
+
+
+class TestFindRoleByName:
+    """Test role lookup by name."""
+
+    def test_lookups_always_ask_the_server(self):
+        """Test that a role deleted on the server is not returned from memory."""
+        raw = _FakeRoleRaw([{"id": 7, "name": "reader"}])
+        sdk = SDKClient(raw)
+
+        assert sdk.create_table_role("reader", "", []) == (7, False)
+        raw.roles.clear()
+        assert sdk._find_role_by_name("reader") is None
+        assert raw.list_calls == 2
+
+    def test_created_role_is_found_by_later_calls(self):
+        """Test that a role created through create_table_role is reused."""
+        raw = _FakeRoleRaw([])
+        sdk = SDKClient(raw)
+
+        assert sdk.create_table_role("writer", "", []) == (99, True)
+        assert sdk.create_table_role("writer", "", []) == (99, False)
+
+
+class TestImportLocalFileToTableConfig:
+    """Test table_config handling in import_local_file_to_table."""
+
+    def test_caller_config_is_not_mutated(self):
+        """Test that defaults are filled on a copy and nested values are shared."""
+        class Raw:
+            def upload_connector_file(self, volume_id, **kwargs):
+                self.kwargs = kwargs
+                return {"ok": True}
+
+        raw = Raw()
+        columns = [{"name": "id"}]
+        table_config = {
+            "new_table": False,
+            "table_id": 1,
+            "conn_file_ids": ["f-1"],
+            "existed_table": None,
+            "existed_table_opts": ExistedTableOptions(method=ExistedTableOption.OVERWRITE),
+            "columns": columns,
+        }
+
+        SDKClient(raw).import_local_file_to_table(table_config)
+
+        sent = raw.kwargs["table_config"]
+        assert sent["existed_table"] == []
+        assert sent["existed_table_opts"] == {"method": "overwrite"}
+        assert table_config["existed_table"] is None
+        assert isinstance(table_config["existed_table_opts"], ExistedTableOptions)
+        assert sent["columns"] is columns
+
+
+class TestNormalizeTablePriv:
+    """Test conversion of table privilege entries into role payloads."""
+
+    def test_table_priv_info_and_dict_match(self):
+        """Test that TablePrivInfo and dict entries produce the same payload."""
+        from moi import TablePrivInfo
+
+        expected = {
+            "id": "301",
+            "category": "table",
+            "name": "",
+            "authority_code_list": [{"code": "DT8", "rule_list": None}],
+        }
+        assert SDKClient._normalize_table_priv(TablePrivInfo(table_id=301, priv_codes=["DT8"])) == expected
+        assert SDKClient._normalize_table_priv({"table_id": 301, "priv_codes": ["DT8"]}) == expected
+
+    def test_explicit_authority_codes_and_empty_entries(self):
+        """Test that explicit ACLs win and entries without privileges are skipped."""
+        from moi import TablePrivInfo
+
+        acl = [{"code": "DT9", "rule_list": None}]
+        payload = SDKClient._normalize_table_priv(
+            TablePrivInfo(table_id=1, priv_codes=["DT8"], authority_code_list=acl)
+        )
+        assert payload["authority_code_list"] == acl
+        assert SDKClient._normalize_table_priv(TablePrivInfo(table_id=1)) is None
+        assert SDKClient._normalize_table_priv(TablePrivInfo(table_id=0, priv_codes=["DT8"])) is None
+        with pytest.raises(TypeError):
+            SDKClient._normalize_table_priv(301)
+
+
+class TestUpdateTableRoleCurrentRole:
+    """Test reusing caller-supplied role data in update_table_role."""
+
+    class _Raw:
+        def __init__(self):
+            self.get_calls = 0
+            self.updates = []
+
+        def get_role(self, request):
+            self.get_calls += 1
+            return {"description": "fetched", "authority_list": [{"code": "G1"}]}
+
+        def update_role_info(self, payload):
+            self.updates.append(payload)
+            return {}
+
+    def test_current_role_skips_get_role(self):
+        """Test that a supplied role is used instead of fetching it."""
+        raw = self._Raw()
+        current = {"description": "known", "authority_list": [{"code": "G2"}]}
+
+        SDKClient(raw).update_table_role(7, "", [], None, current_role=current)
+
+        assert raw.get_calls == 0
+        assert raw.updates[0]["description"] == "known"
+        assert raw.updates[0]["authority_code_list"] == ["G2"]
+
+    def test_role_is_fetched_without_current_role(self):
+        """Test that the role is still fetched when nothing is supplied."""
+        raw = self._Raw()
+
+        SDKClient(raw).update_table_role(7, "", [], None)
+
+        assert raw.get_calls == 1
+        assert raw.updates[0]["description"] == "fetched"
+
+
+class TestBuildObjPrivList:
+    """Test building obj_authority_code_list payloads."""
+
+    def test_skips_entries_without_privileges(self):
+        """Test that None and empty entries are dropped and order is kept."""
+        from moi import TablePrivInfo
+
+        result = SDKClient(object())._build_obj_priv_list(
+            [
+                TablePrivInfo(table_id=1, priv_codes=["DT8"]),
+                None,
+                TablePrivInfo(table_id=2),
+                {"table_id": 3, "priv_codes": ["DT9"]},
+            ]
+        )
+
+        assert [item["id"] for item in result] == ["1", "3"]
+
+
+class _PagedRoleRaw:
+    """RawClient stand-in that pages through a role list."""
+
+    def __init__(self, roles):
+        self.roles = roles
+        self.pages = []
+
+    def list_roles(self, request):
+        condition = request["common_condition"]
+        page, size = condition["page"], condition["page_size"]
+        self.pages.append(page)
+        start = (page - 1) * size
+        return {"role_list": self.roles[start:start + size], "total": len(self.roles)}
+
+
+class TestIterRolePages:
+    """Test paged role scanning with prefetch."""
+
+    def test_scans_all_pages_in_order(self):
+        """Test that every page is yielded once, in order."""
+        roles = [{"id": i, "name": f"r{i}"} for i in range(25)]
+        raw = _PagedRoleRaw(roles)
+
+        pages = list(SDKClient(raw)._iter_role_pages("r", page_size=10))
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert sorted(raw.pages) == [1, 2, 3]
+
+    def test_single_page_fetches_once(self):
+        """Test that a short first page ends the scan without prefetching."""
+        raw = _PagedRoleRaw([{"id": 1, "name": "reader"}])
+
+        assert SDKClient(raw)._find_role_by_name("reader") == {"id": 1, "name": "reader"}
+        assert raw.pages == [1]
+
+    def test_find_role_on_later_page(self):
+        """Test that a role beyond the first page is found."""
+        roles = [{"id": i, "name": f"r{i}"} for i in range(250)]
+        raw = _PagedRoleRaw(roles)
+
+        assert SDKClient(raw)._find_role_by_name("r230") == {"id": 230, "name": "r230"}
+
+    def test_early_exit_waits_for_prefetch(self):
+        """Test that a match on the first page leaves no request running."""
+        import threading
+        import time
+
+        class SlowPagedRaw(_PagedRoleRaw):
+            def __init__(self, roles):
+                super().__init__(roles)
+                self.in_flight = 0
+                self.lock = threading.Lock()
+
+            def list_roles(self, request):
+                with self.lock:
+                    self.in_flight += 1
+                if request["common_condition"]["page"] > 1:
+                    time.sleep(0.05)
+                try:
+                    return super().list_roles(request)
+                finally:
+                    with self.lock:
+                        self.in_flight -= 1
+
+        raw = SlowPagedRaw([{"id": i, "name": f"r{i}"} for i in range(250)])
+
+        assert SDKClient(raw)._find_role_by_name("r3") == {"id": 3, "name": "r3"}
+        assert raw.in_flight == 0
+
+    def test_max_pages_bounds_the_scan(self):
+        """Test that no page past max_pages is requested."""
+        raw = _PagedRoleRaw([{"id": i, "name": "x"} for i in range(50)])
+
+        with pytest.warns(RuntimeWarning, match="after 2 pages"):
+            pages = list(SDKClient(raw)._iter_role_pages("x", page_size=10, max_pages=2))
+
+        assert len(pages) == 2
+        assert sorted(raw.pages) == [1, 2]
+
+    def test_default_bound_warns_when_role_is_not_found(self):
+        """Test that a lookup scans ten pages and warns that it stopped early."""
+        raw = _PagedRoleRaw([{"id": i, "name": f"other{i}"} for i in range(2000)])
+
+        with pytest.warns(RuntimeWarning, match="'target' after 10 pages"):
+            assert SDKClient(raw)._find_role_by_name("target") is None
+
+        assert sorted(raw.pages) == list(range(1, 11))
+
+    def test_exact_page_count_does_not_warn(self):
+        """Test that reaching the last page within the bound is not reported."""
+        import warnings
+
+        raw = _PagedRoleRaw([{"id": i, "name": "x"} for i in range(20)])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            pages = list(SDKClient(raw)._iter_role_pages("x", page_size=10, max_pages=2))
+
+        assert len(pages) == 2
+
+
+class TestRunSQLPayload:
+    """Test the pre-encoded run_sql request body."""
+
+    def test_body_matches_dict_encoding(self):
+        """Test that the template produces the same JSON as the dict payload."""
+        import json
+        from moi import RawClient
+        from moi.options import with_http_client
+        from tests.test_raw_client import FakeSession
+
+        session = FakeSession()
+        sdk = SDKClient(RawClient("https://api.example.com", "key", with_http_client(session)))
+        statement = 'select "名称", \'a\\b\' from t -- \n'
+
+        sdk.run_sql(statement)
+
+        call = session.calls[0]
+        assert call["url"] == "https://api.example.com/catalog/nl2sql/run_sql"
+        assert json.loads(call["data"]) == {"operation": "run_sql", "statement": statement}
+
+
+class TestCreateTableRoleResponses:
+    """Test handling of unexpected create_role/list_roles responses."""
+
+    @pytest.mark.parametrize("response", [{}, None, [], "ok"])
+    def test_missing_id_returns_none(self, response):
+        """Test that responses without an id yield (None, True)."""
+        class Raw:
+            def list_roles(self, request):
+                return None
+
+            def create_role(self, payload):
+                return response
 
+        assert SDKClient(Raw()).create_table_role("new_role", "", []) == (None, True)
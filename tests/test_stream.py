@@ -0,0 +1,413 @@
+"""Offline tests for FileStream download helpers."""
+
+import io
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+from urllib3 import HTTPResponse
+
+from moi.stream import DEFAULT_CHUNK_SIZE, FileStream
+
+
+def make_response(body, headers=None):
+    """Build a streaming requests.Response backed by an in-memory body."""
+    headers = headers or {}
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = CaseInsensitiveDict(headers)
+    response.raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        status=200,
+        preload_content=False,
+    )
+    return response
+
+
+class TestIterContent:
+    """Test FileStream.iter_content."""
+
+    def test_default_chunk_size(self):
+        """Test that the default chunk size is 1 MiB."""
+        body = b"x" * (DEFAULT_CHUNK_SIZE + 10)
+        chunks = list(FileStream(make_response(body)).iter_content())
+
+        assert DEFAULT_CHUNK_SIZE == 1024 * 1024
+        assert [len(chunk) for chunk in chunks] == [DEFAULT_CHUNK_SIZE, 10]
+
+    def test_custom_chunk_size(self):
+        """Test that callers can still request smaller chunks."""
+        chunks = list(FileStream(make_response(b"abcdefg")).iter_content(3))
+
+        assert chunks == [b"abc", b"def", b"g"]
+
+
+class TestWriteToFile:
+    """Test FileStream.write_to_file."""
+
+    def test_writes_body(self, tmp_path):
+        """Test that the whole body is written and its size returned."""
+        body = bytes(range(256)) * 100
+        dest = tmp_path / "out" / "data.bin"
+
+        written = FileStream(make_response(body)).write_to_file(str(dest))
+
+        assert written == len(body)
+        assert dest.read_bytes() == body
+
+    def test_reads_from_urllib3_stream(self, monkeypatch):
+        """Test that urllib3 responses are read without requests' wrapper."""
+        response = make_response(b"abc")
+        monkeypatch.setattr(
+            response, "iter_content", lambda *a, **k: pytest.fail("requests iter_content used")
+        )
+
+        stream = FileStream(response)
+
+        assert b"".join(stream.iter_content(2)) == b"abc"
+        with pytest.raises(requests.exceptions.StreamConsumedError):
+            stream.iter_content(2)
+
+    def test_returns_fallback_iterator(self):
+        """Test that the requests fallback iterator is returned without wrapping."""
+        import inspect
+
+        response = make_response(b"abc")
+        sentinel = iter([b"abc"])
+        response.raw = io.BytesIO(b"abc")
+        response.iter_content = lambda *a, **k: sentinel
+
+        assert not inspect.isgeneratorfunction(FileStream.iter_content)
+        assert FileStream(response).iter_content() is sentinel
+
+    def test_decodes_gzip_content(self):
+        """Test that Content-Encoding is decoded like requests does."""
+        import gzip
+
+        response = make_response(gzip.compress(b"hello" * 100), {"Content-Encoding": "gzip"})
+
+        assert b"".join(FileStream(response).iter_content(64)) == b"hello" * 100
+
+    def test_decodes_zstd_content(self):
+        """Test that zstd bodies are decoded when urllib3 has zstd support."""
+        from urllib3 import response as urllib3_response
+
+        if not getattr(urllib3_response, "HAS_ZSTD", False):
+            pytest.skip("urllib3 zstd support is not installed")
+        body = b"row,value\n" * 1000
+        compressed = urllib3_response.zstd.compress(body)
+
+        stream = FileStream(make_response(compressed, {"Content-Encoding": "zstd"}))
+        assert b"".join(stream.iter_content(256)) == body
+        stream = FileStream(make_response(compressed, {"Content-Encoding": "zstd"}))
+        assert stream.read() == body
+
+    def test_protocol_errors_are_translated(self):
+        """Test that urllib3 errors surface as requests exceptions."""
+        from urllib3.exceptions import ProtocolError
+
+        class BrokenBody(io.BytesIO):
+            def read(self, *args):
+                raise ProtocolError("connection broken")
+
+        response = make_response(b"")
+        response.raw = HTTPResponse(body=BrokenBody(), status=200, preload_content=False)
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            list(FileStream(response).iter_content())
+
+    def test_non_urllib3_body_falls_back(self):
+        """Test that other raw objects still go through requests."""
+        response = make_response(b"")
+        response.raw = io.BytesIO(b"plain body")
+
+        assert b"".join(FileStream(response).iter_content(4)) == b"plain body"
+
+
+class TestIterInto:
+    """Test buffer-reusing reads and the buffer pool."""
+
+    def test_views_cover_body(self):
+        """Test that the yielded views reassemble the body."""
+        import gzip
+
+        body = bytes(range(256)) * 40
+        response = make_response(gzip.compress(body), {"Content-Encoding": "gzip"})
+        buf = bytearray(1000)
+
+        out = bytearray()
+        for view in FileStream(response).iter_into(buf):
+            assert view.obj is buf
+            out += view
+
+        assert bytes(out) == body
+
+    def test_protocol_errors_are_translated(self):
+        """Test that iter_into raises requests exceptions like iter_content."""
+        from urllib3.exceptions import ProtocolError
+
+        class BrokenBody(io.BytesIO):
+            def read(self, *args):
+                raise ProtocolError("connection broken")
+
+        response = make_response(b"")
+        response.raw = HTTPResponse(body=BrokenBody(), status=200, preload_content=False)
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            list(FileStream(response).iter_into(bytearray(16)))
+
+    def test_pool_reuses_buffers(self):
+        """Test that released buffers are handed out again."""
+        from moi.stream import acquire_buffer, release_buffer
+
+        buf = acquire_buffer(4096)
+        release_buffer(buf)
+
+        assert acquire_buffer(4096) is buf
+        assert len(acquire_buffer(2048)) == 2048
+
+
+class TestRead:
+    """Test FileStream.read and read_into."""
+
+    def test_read_all(self):
+        """Test that read() returns the whole decoded body."""
+        import gzip
+
+        body = b"x" * (DEFAULT_CHUNK_SIZE + 123)
+        response = make_response(gzip.compress(body), {"Content-Encoding": "gzip"})
+
+        data = FileStream(response).read()
+
+        assert type(data) is bytes
+        assert data == body
+
+    def test_read_sized(self):
+        """Test that read(size) returns at most size bytes."""
+        stream = FileStream(make_response(b"abcdef"))
+
+        assert stream.read(4) == b"abcd"
+        assert stream.read() == b"ef"
+
+    def test_sized_reads_of_gzip_body(self):
+        """Test that sized reads never exceed size and reassemble the body."""
+        import gzip
+
+        body = bytes(range(256)) * 400
+        stream = FileStream(make_response(gzip.compress(body), {"Content-Encoding": "gzip"}))
+
+        parts = []
+        while True:
+            part = stream.read(1000)
+            if not part:
+                break
+            assert len(part) <= 1000
+            parts.append(part)
+
+        assert b"".join(parts) == body
+        assert stream.read(10) == b""
+
+    def test_read_rest_after_sized_read(self):
+        """Test that read() returns what is left after a sized read."""
+        import gzip
+
+        body = b"hello world" * 500
+        stream = FileStream(make_response(gzip.compress(body), {"Content-Encoding": "gzip"}))
+
+        head = stream.read(5)
+
+        assert head + stream.read() == body
+
+    def test_read_into_gzip_body(self):
+        """Test that read_into fills the buffer from a compressed body."""
+        import gzip
+
+        body = bytes(range(256)) * 400
+        stream = FileStream(make_response(gzip.compress(body), {"Content-Encoding": "gzip"}))
+        buf = bytearray(1000)
+
+        out = bytearray()
+        while True:
+            count = stream.read_into(buf)
+            if not count:
+                break
+            out += buf[:count]
+
+        assert bytes(out) == body
+
+    def test_read_into(self):
+        """Test that read_into fills the caller's buffer until EOF."""
+        stream = FileStream(make_response(b"abcdefg"))
+        buf = bytearray(4)
+
+        assert stream.read_into(buf) == 4
+        assert buf == b"abcd"
+        assert stream.read_into(buf) == 3
+        assert buf[:3] == b"efg"
+        assert stream.read_into(buf) == 0
+
+
+class TestContentLength:
+    """Test FileStream.content_length."""
+
+    def test_content_length(self):
+        """Test that Content-Length is parsed, and missing or bad values give None."""
+        assert FileStream(make_response(b"abc", {"Content-Length": "3"})).content_length == 3
+        assert FileStream(make_response(b"abc")).content_length is None
+        assert FileStream(make_response(b"abc", {"Content-Length": "x"})).content_length is None
+
+
+class TestEagerRead:
+    """Test that small bodies are buffered and the response released."""
+
+    def test_small_body_is_buffered(self):
+        """Test that a short Content-Length body is read and the response closed."""
+        body = b"a,b\n1,2\n"
+        response = make_response(body, {"Content-Length": str(len(body))})
+
+        stream = FileStream(response)
+
+        assert response.raw.isclosed()
+        assert stream.body is response.raw
+        assert stream.read(4) == b"a,b\n"
+        assert b"".join(stream.iter_content(2)) == b"1,2\n"
+
+    def test_small_gzip_body_is_decoded(self):
+        """Test that buffered bodies are decoded like streamed ones."""
+        import gzip
+
+        compressed = gzip.compress(b"hello" * 100)
+        response = make_response(
+            compressed, {"Content-Encoding": "gzip", "Content-Length": str(len(compressed))}
+        )
+
+        assert FileStream(response).read() == b"hello" * 100
+
+    def test_threshold(self, monkeypatch):
+        """Test that bodies at or above the threshold, or without a length, stay streaming."""
+        monkeypatch.setattr("moi.stream.EAGER_READ_BYTES", 4)
+
+        at_limit = FileStream(make_response(b"abcd", {"Content-Length": "4"}))
+        no_length = FileStream(make_response(b"ab"))
+
+        assert not at_limit.body.isclosed()
+        assert not no_length.body.isclosed()
+        assert at_limit.read() == b"abcd"
+
+    def test_threshold_from_env(self, monkeypatch):
+        """Test that MOI_STREAM_EAGER_BYTES is read when each stream is created."""
+        headers = {"Content-Length": "3"}
+
+        monkeypatch.setenv("MOI_STREAM_EAGER_BYTES", "2")
+        assert not FileStream(make_response(b"abc", headers)).body.isclosed()
+        monkeypatch.setenv("MOI_STREAM_EAGER_BYTES", "1024")
+        assert FileStream(make_response(b"abc", headers)).body.isclosed()
+        monkeypatch.setenv("MOI_STREAM_EAGER_BYTES", "lots")
+        assert FileStream(make_response(b"abc", headers)).body.isclosed()
+
+
+class TestCopyTo:
+    """Test FileStream.copy_to."""
+
+    def test_copies_into_file_object(self):
+        """Test that the body lands in fp and the byte count is returned."""
+        body = b"row\n" * 5000
+        out = io.BytesIO()
+
+        written = FileStream(make_response(body)).copy_to(out, chunk_size=1024)
+
+        assert written == len(body)
+        assert out.getvalue() == body
+
+    def test_copies_gzip_body(self):
+        """Test that compressed downloads are decoded on the way to fp."""
+        import gzip
+
+        body = bytes(range(256)) * 400
+        response = make_response(gzip.compress(body), {"Content-Encoding": "gzip"})
+        out = io.BytesIO()
+
+        written = FileStream(response).copy_to(out, chunk_size=1024)
+
+        assert written == len(body)
+        assert out.getvalue() == body
+
+
+@pytest.fixture
+def chunked_server():
+    """Serve a 300,000-byte body with Transfer-Encoding: chunked on localhost."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+
+    body = bytes(range(256)) * 1200 + b"tail" * 75
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for start in range(0, len(body), 10000):
+                part = body[start:start + 10000]
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(part), part))
+            self.wfile.write(b"0\r\n\r\n")
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}/file", body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestChunkedBody:
+    """Test FileStream reads of a Transfer-Encoding: chunked response."""
+
+    def test_sized_reads(self, chunked_server):
+        """Test that a read(size) loop returns the whole chunked body."""
+        url, body = chunked_server
+        stream = FileStream(requests.get(url, stream=True, timeout=5))
+
+        parts = []
+        while True:
+            part = stream.read(4096)
+            if not part:
+                break
+            parts.append(part)
+
+        assert b"".join(parts) == body
+
+    def test_read_into(self, chunked_server):
+        """Test that a read_into loop returns the whole chunked body."""
+        url, body = chunked_server
+        stream = FileStream(requests.get(url, stream=True, timeout=5))
+        buf = bytearray(4096)
+
+        out = bytearray()
+        while True:
+            count = stream.read_into(buf)
+            if not count:
+                break
+            out += buf[:count]
+
+        assert bytes(out) == body
+
+    def test_mixed_reads(self, chunked_server):
+        """Test that read, read_into, iter_content and read() continue one another."""
+        url, body = chunked_server
+        stream = FileStream(requests.get(url, stream=True, timeout=5))
+        buf = bytearray(1000)
+
+        head = stream.read(100)
+        count = stream.read_into(buf)
+        middle = b"".join(chunk for _, chunk in zip(range(3), stream.iter_content(5000)))
+        rest = stream.read()
+
+        assert head + bytes(buf[:count]) + middle + rest == body